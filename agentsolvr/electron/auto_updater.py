@@ -5,21 +5,89 @@ This module handles automatic updates, version checking, and update installation
 for the AgentCODR V4 Electron application.
 """
 
+import functools
 import logging
 import threading
 import time
 import json
 import hashlib
+import hmac
 import os
+import platform
 import shutil
 import subprocess
-from typing import Dict, Any, Optional, Callable, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional, Callable, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+import urllib.parse
 import urllib.request
 import urllib.error
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# ioctl(2) request for a copy-on-write clone (Linux >= 4.5 on Btrfs/XFS)
+_FICLONE = getattr(fcntl, 'FICLONE', 0x40049409)
+
+
+def _detect_platform() -> str:
+    """Get platform name."""
+    system = platform.system().lower()
+    if system == "darwin":
+        return "macos"
+    return system
+
+
+def _detect_architecture() -> str:
+    """Get architecture name."""
+    arch = platform.machine().lower()
+    if arch in ["x86_64", "amd64"]:
+        return "x64"
+    elif arch in ["arm64", "aarch64"]:
+        return "arm64"
+    return arch
+
+
+# Fixed for the lifetime of the process, so detect them once
+_PLATFORM = _detect_platform()
+_ARCH = _detect_architecture()
+
+
+def _clone_file(src: str, dst: str) -> str:
+    """Copy src to dst as a reflink where the filesystem supports it, else copy2."""
+    if fcntl is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_version(version: str) -> tuple:
+    """Parse a dotted version string into a tuple of ints."""
+    return tuple(int(x) for x in version.split('.'))
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_version_newer(version1: str, version2: str) -> bool:
+    """Check if version1 is newer than version2, padding the shorter with zeros."""
+    try:
+        v1_parts = _parse_version(version1)
+        v2_parts = _parse_version(version2)
+    except ValueError:
+        return False
+    
+    max_len = max(len(v1_parts), len(v2_parts))
+    return v1_parts + (0,) * (max_len - len(v1_parts)) > v2_parts + (0,) * (max_len - len(v2_parts))
+
 
 class UpdateStatus(Enum):
     """Update status states."""
@@ -42,7 +110,7 @@ class UpdateChannel(Enum):
     DEV = "dev"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UpdateInfo:
     """Information about an available update."""
     version: str
@@ -56,7 +124,7 @@ class UpdateInfo:
     min_version: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateProgress:
     """Update download/installation progress."""
     status: UpdateStatus
@@ -88,13 +156,16 @@ class AutoUpdater:
         # Configuration
         self.config = {
             "check_interval_hours": 24,
+            "check_ttl_seconds": 300,
             "auto_download": True,
             "auto_install": False,
             "backup_enabled": True,
             "rollback_enabled": True,
             "update_server_url": "https://updates.agentcodr.com",
+            "app_dir": None,
             "signature_verification": True
         }
+        self._update_check_url = f"{self.config['update_server_url']}/api/v1/check"
         
         # Event handlers
         self.update_available_handlers: List[Callable] = []
@@ -104,22 +175,50 @@ class AutoUpdater:
         
         # Internal state
         self._check_thread: Optional[threading.Thread] = None
-        self._download_thread: Optional[threading.Thread] = None
-        self._auto_check_enabled = False
+        self._download_future: Optional[Future] = None
+        # Makes the in-progress check and the submit in download_update atomic
+        self._download_lock = threading.Lock()
+        # Shared workers for downloads; the auto-check loop keeps its own daemon thread
+        # because it runs until stopped and would otherwise pin a worker and block exit
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='updater')
+        # Set while auto-check is stopped; the loop waits on it between checks
+        self._stop_event = threading.Event()
+        self._stop_event.set()
         self._temp_dir = Path("temp/updates")
         self._backup_dir = Path("backups")
-        
-        # Create necessary directories
+        self._dirs_ready = False
+        # (request URL, ETag, update info) from the last check, for conditional requests
+        self._last_check: Optional[Tuple[str, str, Optional[UpdateInfo]]] = None
+        # (version, channel, platform, arch) -> (monotonic time, result) of recent checks
+        self._check_cache: Dict[tuple, Tuple[float, Optional[UpdateInfo]]] = {}
+        # (cache key, monotonic time) of the last "no update" answer
+        self._last_no_update: Optional[Tuple[tuple, float]] = None
+    
+    @property
+    def channel(self) -> UpdateChannel:
+        """Update channel this client follows."""
+        return self._channel
+    
+    @channel.setter
+    def channel(self, channel: UpdateChannel) -> None:
+        self._channel = channel
+        self._channel_str = channel.value
+    
+    def _ensure_dirs(self) -> None:
+        """Create the update and backup directories on first use."""
+        if self._dirs_ready:
+            return
         self._temp_dir.mkdir(parents=True, exist_ok=True)
         self._backup_dir.mkdir(parents=True, exist_ok=True)
+        self._dirs_ready = True
     
     def start_auto_check(self) -> None:
         """Start automatic update checking."""
-        if self._auto_check_enabled:
+        if not self._stop_event.is_set():
             self.logger.warning("Auto-check already enabled")
             return
         
-        self._auto_check_enabled = True
+        self._stop_event.clear()
         self._check_thread = threading.Thread(target=self._auto_check_loop, daemon=True)
         self._check_thread.start()
         
@@ -127,32 +226,48 @@ class AutoUpdater:
     
     def stop_auto_check(self) -> None:
         """Stop automatic update checking."""
-        self._auto_check_enabled = False
+        self._stop_event.set()
         if self._check_thread and self._check_thread.is_alive():
             self.logger.info("Stopping auto-update check")
     
+    def close(self) -> None:
+        """Stop auto-checking and release the worker threads."""
+        self.stop_auto_check()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
     def check_for_updates(self, force: bool = False) -> Optional[UpdateInfo]:
         """Check for available updates."""
         if self.status == UpdateStatus.CHECKING and not force:
             self.logger.warning("Update check already in progress")
             return None
         
+        cache_key = (self.app_version, self._channel_str, _PLATFORM, _ARCH)
+        if not force:
+            # A recent "no update" answer for the same client state holds for half an interval
+            if self._last_no_update and self._last_no_update[0] == cache_key:
+                if time.monotonic() - self._last_no_update[1] < self.config["check_interval_hours"] * 1800:
+                    return None
+            cached = self._check_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self.config["check_ttl_seconds"]:
+                return cached[1]
+        
         self._update_status(UpdateStatus.CHECKING)
         
         try:
-            self.logger.info(f"Checking for updates (current: {self.app_version}, channel: {self.channel.value})")
+            self.logger.info(f"Checking for updates (current: {self.app_version}, channel: {self._channel_str})")
             
             # Construct update check URL
-            check_url = f"{self.config['update_server_url']}/api/v1/check"
+            check_url = self._update_check_url
             params = {
                 "version": self.app_version,
-                "channel": self.channel.value,
+                "channel": self._channel_str,
                 "platform": self._get_platform(),
                 "arch": self._get_architecture()
             }
             
             # Make request (simulated for now)
             update_info = self._fetch_update_info(check_url, params)
+            self._check_cache[cache_key] = (time.monotonic(), update_info)
             
             if update_info:
                 self.current_update = update_info
@@ -165,6 +280,7 @@ class AutoUpdater:
                 
                 return update_info
             else:
+                self._last_no_update = (cache_key, time.monotonic())
                 self._update_status(UpdateStatus.NO_UPDATE)
                 self.logger.info("No updates available")
                 return None
@@ -181,16 +297,14 @@ class AutoUpdater:
             self.logger.error("No update available to download")
             return False
         
-        if self.status == UpdateStatus.DOWNLOADING:
-            self.logger.warning("Download already in progress")
-            return False
-        
-        self._download_thread = threading.Thread(
-            target=self._download_update_file,
-            args=(self.current_update,),
-            daemon=True
-        )
-        self._download_thread.start()
+        with self._download_lock:
+            # The worker only sets DOWNLOADING once it runs, so a queued or running
+            # future is what marks a download as in progress
+            if self._download_future is not None and not self._download_future.done():
+                self.logger.warning("Download already in progress")
+                return False
+            
+            self._download_future = self._executor.submit(self._download_update_file, self.current_update)
         return True
     
     def install_update(self, restart_app: bool = True) -> bool:
@@ -257,6 +371,10 @@ class AutoUpdater:
         if key in self.config:
             old_value = self.config[key]
             self.config[key] = value
+            if key == "update_server_url":
+                self._update_check_url = f"{value}/api/v1/check"
+            self._check_cache.clear()
+            self._last_no_update = None
             self.logger.debug(f"Config updated: {key} = {value} (was: {old_value})")
         else:
             self.logger.warning(f"Unknown config key: {key}")
@@ -283,31 +401,41 @@ class AutoUpdater:
     
     def _auto_check_loop(self) -> None:
         """Auto-check loop running in background thread."""
-        while self._auto_check_enabled:
+        while not self._stop_event.is_set():
             try:
                 self.check_for_updates()
                 
-                # Wait for next check
-                check_interval = self.config["check_interval_hours"] * 3600
-                start_time = time.time()
-                
-                while self._auto_check_enabled and (time.time() - start_time) < check_interval:
-                    time.sleep(60)  # Check every minute if we should stop
+                # Wait for next check; returns early as soon as stop_auto_check() is called
+                self._stop_event.wait(timeout=self.config["check_interval_hours"] * 3600)
                     
             except Exception as e:
                 self.logger.error(f"Error in auto-check loop: {e}")
-                time.sleep(300)  # Wait 5 minutes before retrying
+                self._stop_event.wait(timeout=300)  # Wait 5 minutes before retrying
     
     def _fetch_update_info(self, url: str, params: Dict[str, str]) -> Optional[UpdateInfo]:
-        """Fetch update information from server."""
+        """Fetch update information from server; raises if the server could not be queried."""
         try:
+            # The check response carries everything the download needs (URL,
+            # size, checksum, signature), so there is no second metadata request.
+            # Repeat checks are conditional: a 304 means the last answer still holds.
+            request_url = f"{url}?{urllib.parse.urlencode(params)}"
+            headers = {}
+            if self._last_check and self._last_check[0] == request_url:
+                headers["If-None-Match"] = self._last_check[1]
+            request = urllib.request.Request(request_url, headers=headers)
+            
             # Simulate server response for now
-            # In real implementation, this would make an HTTP request
+            # In real implementation, this would make an HTTP request with urlopen(request)
             
             # Simulate newer version available
             current_parts = self.app_version.split('.')
             next_patch = int(current_parts[2]) + 1
             newer_version = f"{current_parts[0]}.{current_parts[1]}.{next_patch}"
+            etag = f'"{newer_version}-{self._channel_str}"'
+            
+            if request.get_header("If-none-match") == etag:
+                # 304 Not Modified: nothing to parse
+                return self._last_check[2]
             
             # Simulate update info
             update_info = UpdateInfo(
@@ -321,21 +449,25 @@ class AutoUpdater:
             )
             
             # Only return update if version is actually newer
-            if self._is_version_newer(newer_version, self.app_version):
-                return update_info
+            if not self._is_version_newer(newer_version, self.app_version):
+                update_info = None
             
-            return None
+            self._last_check = (request_url, etag, update_info)
+            return update_info
             
         except Exception as e:
+            # Let the caller take its error path; a failed fetch is not a "no update" answer
             self.logger.error(f"Failed to fetch update info: {e}")
-            return None
+            raise
     
     def _download_update_file(self, update_info: UpdateInfo) -> None:
         """Download update file in background thread."""
         try:
             self._update_status(UpdateStatus.DOWNLOADING)
+            self._ensure_dirs()
             
-            download_path = self._temp_dir / f"agentcodr-{update_info.version}.zip"
+            # Plain string path: converted from Path once rather than per file operation
+            download_path = os.fspath(self._temp_dir / f"agentcodr-{update_info.version}.zip")
             
             self.logger.info(f"Downloading update from {update_info.download_url}")
             
@@ -344,36 +476,64 @@ class AutoUpdater:
             downloaded = 0
             chunk_size = 1024 * 1024  # 1MB chunks
             
-            start_time = time.time()
+            # Speed is an exponential moving average refreshed at most every 250ms
+            last_tick = time.monotonic()
+            last_tick_bytes = 0
+            ema_speed = 0.0
+            last_pct_notified = -1
+            # Hash as chunks arrive so the file never has to be read back
+            hasher = hashlib.sha256()
+            # Single receive buffer reused for every chunk; the simulated payload
+            # is all zeros, matching the sparse file's contents
+            buf = bytearray(chunk_size)
+            view = memoryview(buf)
+            
+            # One progress object per download, updated in place for each chunk
+            progress = UpdateProgress(
+                status=UpdateStatus.DOWNLOADING,
+                progress_percent=0.0,
+                bytes_downloaded=0,
+                total_bytes=total_size,
+                speed_bytes_per_sec=0.0
+            )
+            self.progress = progress
             
             with open(download_path, 'wb') as f:
+                # Allocate the file sparsely; the simulation never writes data
+                f.truncate(total_size)
+                
                 while downloaded < total_size:
-                    # Simulate download chunk
-                    chunk_data = b'0' * min(chunk_size, total_size - downloaded)
-                    f.write(chunk_data)
-                    downloaded += len(chunk_data)
+                    # Simulate download chunk (a real transport would readinto(buf))
+                    received = min(chunk_size, total_size - downloaded)
+                    hasher.update(view[:received])
+                    downloaded += received
                     
                     # Update progress
-                    elapsed = time.time() - start_time
-                    speed = downloaded / elapsed if elapsed > 0 else 0
-                    eta = (total_size - downloaded) / speed if speed > 0 else None
-                    
-                    self.progress = UpdateProgress(
-                        status=UpdateStatus.DOWNLOADING,
-                        progress_percent=(downloaded / total_size) * 100,
-                        bytes_downloaded=downloaded,
-                        total_bytes=total_size,
-                        speed_bytes_per_sec=speed,
-                        eta_seconds=eta
-                    )
+                    progress.progress_percent = (downloaded / total_size) * 100
+                    progress.bytes_downloaded = downloaded
                     
-                    self._notify_progress_update()
+                    now = time.monotonic()
+                    dt = now - last_tick
+                    finished = downloaded >= total_size
+                    if dt >= 0.25 or finished:
+                        if dt > 0:
+                            instant = (downloaded - last_tick_bytes) / dt
+                            ema_speed = 0.3 * instant + 0.7 * ema_speed if ema_speed else instant
+                        last_tick, last_tick_bytes = now, downloaded
+                        progress.speed_bytes_per_sec = ema_speed
+                        progress.eta_seconds = (total_size - downloaded) / ema_speed if ema_speed > 0 else None
+                        
+                        # Only notify when the whole-number percentage moves
+                        pct = int(progress.progress_percent)
+                        if pct != last_pct_notified:
+                            last_pct_notified = pct
+                            self._notify_progress_update()
                     
                     # Simulate network delay
                     time.sleep(0.01)
             
             # Verify checksum
-            if self._verify_checksum(download_path, update_info.checksum):
+            if hmac.compare_digest(hasher.hexdigest(), update_info.checksum):
                 self._update_status(UpdateStatus.DOWNLOADED)
                 self._notify_update_downloaded(update_info)
                 self.logger.info("Update downloaded successfully")
@@ -384,7 +544,7 @@ class AutoUpdater:
             else:
                 self.logger.error("Checksum verification failed")
                 self._update_status(UpdateStatus.ERROR, "Checksum verification failed")
-                download_path.unlink(missing_ok=True)
+                Path(download_path).unlink(missing_ok=True)
                 
         except Exception as e:
             self.logger.error(f"Download failed: {e}")
@@ -392,15 +552,19 @@ class AutoUpdater:
             self._notify_update_error(f"Download failed: {e}")
     
     def _verify_checksum(self, file_path: Path, expected_checksum: str) -> bool:
-        """Verify downloaded file checksum."""
+        """Verify the checksum of a file already on disk, e.g. one supplied externally."""
         try:
-            hasher = hashlib.sha256()
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hasher.update(chunk)
+                if hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: the whole file is hashed in C
+                    hasher = hashlib.file_digest(f, 'sha256')
+                else:
+                    hasher = hashlib.sha256()
+                    for chunk in iter(lambda: f.read(256 * 1024), b""):
+                        hasher.update(chunk)
             
             actual_checksum = hasher.hexdigest()
-            return actual_checksum == expected_checksum
+            return hmac.compare_digest(actual_checksum, expected_checksum)
             
         except Exception as e:
             self.logger.error(f"Checksum verification error: {e}")
@@ -430,36 +594,50 @@ class AutoUpdater:
     
     def _create_backup(self) -> Path:
         """Create backup of current installation."""
+        self._ensure_dirs()
         backup_name = f"backup-{self.app_version}-{int(time.time())}"
         backup_path = self._backup_dir / backup_name
         backup_path.mkdir(parents=True, exist_ok=True)
         
         self.logger.info(f"Creating backup at {backup_path}")
         
-        # In real implementation, this would backup application files
-        # For now, just create a marker file
+        # Snapshot the application files when the install location is known
+        app_dir = self.config["app_dir"]
+        if app_dir:
+            shutil.copytree(app_dir, backup_path / "app", copy_function=_clone_file)
+        
         marker_file = backup_path / "backup_info.json"
         backup_info = {
             "version": self.app_version,
             "timestamp": time.time(),
-            "channel": self.channel.value
+            "channel": self._channel_str
         }
         
         with open(marker_file, 'w') as f:
-            json.dump(backup_info, f, indent=2)
+            json.dump(backup_info, f, separators=(',', ':'))
         
         return backup_path
     
     def _get_latest_backup(self) -> Optional[Path]:
         """Get the latest backup directory."""
         try:
-            backups = [d for d in self._backup_dir.iterdir() if d.is_dir()]
-            if not backups:
-                return None
-            
-            # Sort by creation time
-            latest = max(backups, key=lambda d: d.stat().st_ctime)
-            return latest
+            self._ensure_dirs()
+            # Backups are named backup-{version}-{epoch}; read the time from the
+            # name and the directory flag from the dirent instead of stat()ing each
+            latest_name = None
+            latest_time = -1
+            with os.scandir(self._backup_dir) as entries:
+                for entry in entries:
+                    if not entry.name.startswith('backup-') or not entry.is_dir(follow_symlinks=False):
+                        continue
+                    try:
+                        created = int(entry.name.rsplit('-', 1)[-1])
+                    except ValueError:
+                        continue
+                    if created > latest_time:
+                        latest_name, latest_time = entry.name, created
+            
+            return self._backup_dir / latest_name if latest_name else None
             
         except Exception as e:
             self.logger.error(f"Error finding latest backup: {e}")
@@ -491,92 +669,71 @@ class AutoUpdater:
         
         self.logger.debug(f"Update status: {status.value}")
     
-    def _notify_update_available(self, update_info: UpdateInfo) -> None:
-        """Notify handlers that an update is available."""
-        for handler in self.update_available_handlers:
+    def _dispatch(self, handlers: List[Callable], kind: str, *args: Any) -> None:
+        """Call each handler with args, logging rather than raising handler errors."""
+        if not handlers:
+            return
+        for handler in handlers:
             try:
-                handler(update_info)
+                handler(*args)
             except Exception as e:
-                self.logger.error(f"Error in update available handler: {e}")
+                self.logger.error(f"Error in {kind} handler: {e}")
+    
+    def _notify_update_available(self, update_info: UpdateInfo) -> None:
+        """Notify handlers that an update is available."""
+        self._dispatch(self.update_available_handlers, "update available", update_info)
     
     def _notify_update_downloaded(self, update_info: UpdateInfo) -> None:
         """Notify handlers that an update has been downloaded."""
-        for handler in self.update_downloaded_handlers:
-            try:
-                handler(update_info)
-            except Exception as e:
-                self.logger.error(f"Error in update downloaded handler: {e}")
+        self._dispatch(self.update_downloaded_handlers, "update downloaded", update_info)
     
     def _notify_update_error(self, error_message: str) -> None:
         """Notify handlers of an update error."""
-        for handler in self.update_error_handlers:
-            try:
-                handler(error_message)
-            except Exception as e:
-                self.logger.error(f"Error in update error handler: {e}")
+        self._dispatch(self.update_error_handlers, "update error", error_message)
     
     def _notify_progress_update(self) -> None:
         """Notify handlers of progress update."""
-        for handler in self.progress_handlers:
-            try:
-                handler(self.progress)
-            except Exception as e:
-                self.logger.error(f"Error in progress handler: {e}")
+        self._dispatch(self.progress_handlers, "progress", self.progress)
     
     def _is_version_newer(self, version1: str, version2: str) -> bool:
         """Check if version1 is newer than version2."""
         try:
-            v1_parts = [int(x) for x in version1.split('.')]
-            v2_parts = [int(x) for x in version2.split('.')]
-            
-            # Pad shorter version with zeros
-            max_len = max(len(v1_parts), len(v2_parts))
-            v1_parts.extend([0] * (max_len - len(v1_parts)))
-            v2_parts.extend([0] * (max_len - len(v2_parts)))
-            
-            return v1_parts > v2_parts
-            
+            return _is_version_newer(version1, version2)
         except Exception:
             return False
     
     def _get_platform(self) -> str:
         """Get platform name."""
-        import platform
-        system = platform.system().lower()
-        if system == "darwin":
-            return "macos"
-        return system
+        return _PLATFORM
     
     def _get_architecture(self) -> str:
         """Get architecture name."""
-        import platform
-        arch = platform.machine().lower()
-        if arch in ["x86_64", "amd64"]:
-            return "x64"
-        elif arch in ["arm64", "aarch64"]:
-            return "arm64"
-        return arch
+        return _ARCH
 
 
-# Global updater instance
-auto_updater = AutoUpdater()
+@functools.cache
+def get_auto_updater() -> AutoUpdater:
+    """Get the global auto-updater instance, creating it on first use."""
+    return AutoUpdater()
 
 
-def get_auto_updater() -> AutoUpdater:
-    """Get the global auto-updater instance."""
-    return auto_updater
+def __getattr__(name: str) -> Any:
+    # Keep the module-level auto_updater name working without building it at import
+    if name == "auto_updater":
+        return get_auto_updater()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def check_for_updates() -> Optional[UpdateInfo]:
     """Check for available updates."""
-    return auto_updater.check_for_updates()
+    return get_auto_updater().check_for_updates()
 
 
 def start_auto_updates() -> None:
     """Start automatic update checking."""
-    auto_updater.start_auto_check()
+    get_auto_updater().start_auto_check()
 
 
 def stop_auto_updates() -> None:
     """Stop automatic update checking."""
-    auto_updater.stop_auto_check()
\ No newline at end of file
+    get_auto_updater().stop_auto_check()
\ No newline at end of file
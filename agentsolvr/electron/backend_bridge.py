@@ -5,8 +5,65 @@ This module provides the interface between the Electron frontend
 and the AgentTradr backend services.
 """
 
+import asyncio
+import atexit
+import functools
+import itertools
 import logging
-from typing import Dict, Any, Optional, Callable
+import operator
+import random
+import shlex
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Callable, Mapping, Protocol, Tuple
+
+
+class Handler(Protocol):
+    """IPC message handler: takes the request payload, returns the reply."""
+    
+    def __call__(self, data: Dict[str, Any]) -> Dict[str, Any]: ...
+
+
+# Reply template for messages on channels with no handler
+_UNKNOWN_CHANNEL = 'Unknown channel: %s'
+
+_START_BACKOFF_INITIAL_S = 3.0
+_START_BACKOFF_MAX_S = 60.0
+
+
+def _shutdown_at_exit(bridge_ref: 'weakref.ref[BackendBridge]') -> None:
+    """atexit hook that shuts a bridge down only if it is still alive."""
+    bridge = bridge_ref()
+    if bridge is not None:
+        bridge.shutdown()
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceDescriptor:
+    """Validated, immutable settings for one backend service."""
+    name: str
+    command: Tuple[str, ...] = ()
+    env: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    health_ttl_s: float = 60.0
+    restart_policy: str = 'on-failure'
+    
+    @classmethod
+    def from_config(cls, name: str, config: Dict[str, Any]) -> 'ServiceDescriptor':
+        """Build a descriptor from a service's config section, copying what it keeps."""
+        command = config.get('command', ())
+        if isinstance(command, str):
+            # A command line given as one string, e.g. "python -m worker"
+            command = shlex.split(command)
+        return cls(
+            name=name,
+            command=tuple(command),
+            env=MappingProxyType(dict(config.get('env', {}))),
+            health_ttl_s=float(config.get('health_ttl_s', 60.0)),
+            restart_policy=config.get('restart_policy', 'on-failure')
+        )
 
 
 class BackendService:
@@ -18,22 +75,63 @@ class BackendService:
         self.logger = logging.getLogger(f"{__name__}.{name}")
         self.is_running = False
         self.process = None
+        # (monotonic time, result) of the last health probe
+        self._health_cache = (0.0, False)
+        # Failed starts back off exponentially (3s doubling to 60s, plus jitter)
+        self._next_allowed_start = 0.0
+        self._backoff_s = _START_BACKOFF_INITIAL_S
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """The service's raw config section."""
+        return self._config
+    
+    @config.setter
+    def config(self, config: Dict[str, Any]) -> None:
+        self._config = config
+        self.desc = ServiceDescriptor.from_config(self.name, config)
+    
+    @property
+    def remaining_backoff_s(self) -> float:
+        """Seconds until start() will be attempted again after a failure."""
+        return max(0.0, self._next_allowed_start - time.monotonic())
     
     def start(self) -> bool:
         """Start the backend service."""
+        now = time.monotonic()
+        if now < self._next_allowed_start:
+            self.logger.warning("Service %s start backing off for %.1fs", self.name, self._next_allowed_start - now)
+            return False
+        
         try:
-            self.logger.info(f"Starting service {self.name}")
-            
-            # Service startup logic would go here
-            # This would typically start a subprocess or thread
-            
-            self.is_running = True
-            self.logger.info(f"Service {self.name} started successfully")
-            return True
-            
+            self.logger.info("Starting service %s", self.name)
+            started = self._launch()
+            if not started:
+                self.logger.error("Failed to start service %s", self.name)
         except Exception as e:
-            self.logger.error(f"Failed to start service {self.name}: {e}")
+            self.logger.error("Failed to start service %s: %s", self.name, e)
+            started = False
+        
+        if not started:
+            self._arm_backoff(now)
             return False
+        
+        self.is_running = True
+        self._health_cache = (0.0, False)
+        self._backoff_s = _START_BACKOFF_INITIAL_S
+        self.logger.info("Service %s started successfully", self.name)
+        return True
+    
+    def _launch(self) -> bool:
+        """Bring the service up; returns False if it did not start."""
+        # Service startup logic would go here
+        # This would typically start a subprocess or thread
+        return True
+    
+    def _arm_backoff(self, now: float) -> None:
+        """Refuse further starts for the current backoff (with jitter), then double it."""
+        self._next_allowed_start = now + self._backoff_s * (1.0 + 0.25 * random.random())
+        self._backoff_s = min(self._backoff_s * 2, _START_BACKOFF_MAX_S)
     
     def stop(self) -> bool:
         """Stop the backend service."""
@@ -41,20 +139,34 @@ class BackendService:
             return True
         
         try:
-            self.logger.info(f"Stopping service {self.name}")
+            self.logger.info("Stopping service %s", self.name)
             
             # Service shutdown logic would go here
             
             self.is_running = False
-            self.logger.info(f"Service {self.name} stopped successfully")
+            self._health_cache = (0.0, False)
+            self.logger.info("Service %s stopped successfully", self.name)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to stop service {self.name}: {e}")
+            self.logger.error("Failed to stop service %s: %s", self.name, e)
             return False
     
+    async def start_async(self) -> bool:
+        """Start the service on a worker thread so the event loop is not blocked."""
+        return await asyncio.to_thread(self.start)
+    
+    async def stop_async(self) -> bool:
+        """Stop the service on a worker thread so the event loop is not blocked."""
+        return await asyncio.to_thread(self.stop)
+    
     def restart(self) -> bool:
         """Restart the backend service."""
+        # Don't stop a running service when the start that follows would be refused
+        remaining = self.remaining_backoff_s
+        if remaining > 0:
+            self.logger.warning("Service %s restart backing off for %.1fs", self.name, remaining)
+            return False
         if not self.stop():
             return False
         return self.start()
@@ -64,8 +176,15 @@ class BackendService:
         if not self.is_running:
             return False
         
+        now = time.monotonic()
+        checked_at, healthy = self._health_cache
+        if checked_at and now - checked_at < self.desc.health_ttl_s:
+            return healthy
+        
         # Health check logic would go here
-        return True
+        healthy = True
+        self._health_cache = (now, healthy)
+        return healthy
 
 
 class BackendBridge:
@@ -75,8 +194,27 @@ class BackendBridge:
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.services: Dict[str, BackendService] = {}
-        self.message_handlers: Dict[str, Callable] = {}
+        self.message_handlers: Dict[str, Handler] = {}
+        # Bound lookup on the handler table, rebound whenever the table is rebuilt
+        self._dispatch = self.message_handlers.get
         self.is_initialized = False
+        # Service state generation, bumped by every start/stop/restart issued
+        # through the bridge; next() on itertools.count is atomic under the GIL
+        self._state_gen_counter = itertools.count(1)
+        self._state_gen = 0
+        # Health probe results for the aggregated status as ({name: (running when
+        # probed, healthy)}, generation, monotonic probe time). Published with a
+        # single rebind so readers never take a lock; it is re-probed when the
+        # generation moves, a service's running state changes, or the shortest
+        # health TTL has passed.
+        self._snapshot_ref: Optional[Tuple[Dict[str, Tuple[bool, bool]], int, float]] = None
+        self._snapshot_ttl = 60.0
+        # Suggested delay before the renderer polls status again, jittered by +/-25%
+        self._poll_hint_ms_base = int(config.get('poll_hint_ms', 5000))
+        # Runs health probes in parallel for the aggregated status reply
+        self._probe_pool: Optional[ThreadPoolExecutor] = None
+        # Registered atexit hook; holds the bridge only weakly
+        self._atexit_hook: Optional[Callable[[], None]] = None
     
     def initialize(self) -> bool:
         """Initialize the backend bridge."""
@@ -90,13 +228,45 @@ class BackendBridge:
             self._setup_message_handlers()
             
             self.is_initialized = True
+            if self._atexit_hook is None:
+                self._atexit_hook = functools.partial(_shutdown_at_exit, weakref.ref(self))
+                atexit.register(self._atexit_hook)
             self.logger.info("Backend bridge initialized successfully")
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to initialize backend bridge: {e}")
+            self.logger.error("Failed to initialize backend bridge: %s", e)
             return False
     
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop all services and release the bridge's worker threads and caches."""
+        if self._atexit_hook is not None:
+            atexit.unregister(self._atexit_hook)
+            self._atexit_hook = None
+        self.stop_all_services()
+        
+        if self._probe_pool is not None:
+            self._probe_pool.shutdown(wait=wait, cancel_futures=True)
+            self._probe_pool = None
+        
+        self.services.clear()
+        self.message_handlers.clear()
+        self._snapshot_ref = None
+        self._invalidate_status()
+        self.is_initialized = False
+    
+    def __enter__(self) -> 'BackendBridge':
+        if not self.is_initialized:
+            self.initialize()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
+    
+    def _invalidate_status(self) -> None:
+        """Mark the aggregated status snapshot stale after a service state change."""
+        self._state_gen = next(self._state_gen_counter)
+    
     def _initialize_services(self) -> None:
         """Initialize backend services."""
         services_config = self.config.get('services', {})
@@ -104,11 +274,19 @@ class BackendBridge:
         for service_name, service_config in services_config.items():
             service = BackendService(service_name, service_config)
             self.services[service_name] = service
-            self.logger.debug(f"Registered service: {service_name}")
+            self.logger.debug("Registered service: %s", service_name)
+        
+        if self.services:
+            self._snapshot_ttl = min(service.desc.health_ttl_s for service in self.services.values())
+            if self._probe_pool is None:
+                self._probe_pool = ThreadPoolExecutor(
+                    max_workers=min(32, len(self.services)), thread_name_prefix='health-probe'
+                )
+        self._invalidate_status()
     
     def _setup_message_handlers(self) -> None:
         """Setup message handlers for IPC communication."""
-        self.message_handlers = {
+        self.message_handlers: Dict[str, Handler] = {
             'start_service': self._handle_start_service,
             'stop_service': self._handle_stop_service,
             'restart_service': self._handle_restart_service,
@@ -117,6 +295,7 @@ class BackendBridge:
             'get_market_data': self._handle_market_data,
             'get_portfolio_data': self._handle_portfolio_data
         }
+        self._dispatch = self.message_handlers.get
     
     def start_all_services(self) -> bool:
         """Start all backend services."""
@@ -129,6 +308,7 @@ class BackendBridge:
             if not service.start():
                 success = False
         
+        self._invalidate_status()
         return success
     
     def stop_all_services(self) -> bool:
@@ -138,6 +318,39 @@ class BackendBridge:
             if not service.stop():
                 success = False
         
+        self._invalidate_status()
+        return success
+    
+    async def start_all_services_async(self, timeout: Optional[float] = None) -> bool:
+        """Start all backend services concurrently."""
+        if not self.is_initialized:
+            self.logger.error("Backend bridge not initialized")
+            return False
+        
+        return await self._fan_out('start_async', timeout)
+    
+    async def stop_all_services_async(self, timeout: Optional[float] = None) -> bool:
+        """Stop all backend services concurrently."""
+        return await self._fan_out('stop_async', timeout)
+    
+    async def _fan_out(self, method: str, timeout: Optional[float]) -> bool:
+        """Run a service coroutine method on every service at once, each with its own timeout."""
+        if timeout is None:
+            timeout = self.config.get('service_timeout', 30.0)
+        
+        services = list(self.services.values())
+        results = await asyncio.gather(
+            *(asyncio.wait_for(getattr(service, method)(), timeout) for service in services),
+            return_exceptions=True
+        )
+        self._invalidate_status()
+        
+        success = True
+        for service, result in zip(services, results):
+            if isinstance(result, BaseException):
+                self.logger.error("Service %s %s failed: %r", service.name, method, result)
+            if result is not True:
+                success = False
         return success
     
     def get_service(self, name: str) -> Optional[BackendService]:
@@ -146,55 +359,49 @@ class BackendBridge:
     
     def handle_message(self, channel: str, data: Any) -> Any:
         """Handle incoming messages from the frontend."""
-        handler = self.message_handlers.get(channel)
-        if handler:
-            try:
-                return handler(data)
-            except Exception as e:
-                self.logger.error(f"Error handling message {channel}: {e}")
-                return {'error': str(e)}
-        else:
-            self.logger.warning(f"No handler for channel: {channel}")
-            return {'error': f'Unknown channel: {channel}'}
+        handler = self._dispatch(channel)
+        if handler is None:
+            self.logger.warning("No handler for channel: %s", channel)
+            return {'error': _UNKNOWN_CHANNEL % (channel,)}
+        
+        try:
+            return handler(data)
+        except Exception as e:
+            self.logger.error("Error handling message %s: %s", channel, e)
+            return {'error': str(e)}
     
-    def _handle_start_service(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle start service request."""
+    def _resolve_service(self, data: Dict[str, Any]) -> Tuple[Optional[BackendService], Optional[Dict[str, Any]]]:
+        """Look up the service named in a request; returns (service, None) or (None, error reply)."""
         service_name = data.get('service_name')
         if not service_name:
-            return {'error': 'service_name required'}
+            return None, {'error': 'service_name required'}
         
         service = self.services.get(service_name)
         if not service:
-            return {'error': f'Service {service_name} not found'}
+            return None, {'error': f'Service {service_name} not found'}
+        return service, None
+    
+    def _service_op(self, op: Callable[[BackendService], bool], data: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply a service operation to the service named in a request."""
+        service, error = self._resolve_service(data)
+        if error:
+            return error
         
-        success = service.start()
+        success = op(service)
+        self._invalidate_status()
         return {'success': success}
     
+    def _handle_start_service(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle start service request."""
+        return self._service_op(operator.methodcaller('start'), data)
+    
     def _handle_stop_service(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle stop service request."""
-        service_name = data.get('service_name')
-        if not service_name:
-            return {'error': 'service_name required'}
-        
-        service = self.services.get(service_name)
-        if not service:
-            return {'error': f'Service {service_name} not found'}
-        
-        success = service.stop()
-        return {'success': success}
+        return self._service_op(operator.methodcaller('stop'), data)
     
     def _handle_restart_service(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle restart service request."""
-        service_name = data.get('service_name')
-        if not service_name:
-            return {'error': 'service_name required'}
-        
-        service = self.services.get(service_name)
-        if not service:
-            return {'error': f'Service {service_name} not found'}
-        
-        success = service.restart()
-        return {'success': success}
+        return self._service_op(operator.methodcaller('restart'), data)
     
     def _handle_get_service_status(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle get service status request."""
@@ -205,19 +412,59 @@ class BackendBridge:
                 return {
                     'service': service_name,
                     'running': service.is_running,
-                    'healthy': service.is_healthy()
+                    'healthy': service.is_healthy(),
+                    'remaining_backoff_s': service.remaining_backoff_s
                 }
             else:
                 return {'error': f'Service {service_name} not found'}
         else:
-            # Return status for all services
+            # Return status for all services; only the health probes are cached,
+            # running state is read live
+            now = time.monotonic()
+            snapshot = self._snapshot_ref
+            if (snapshot is None or snapshot[1] != self._state_gen
+                    or now - snapshot[2] >= self._snapshot_ttl
+                    or any(snapshot[0].get(name, (None,))[0] != service.is_running
+                           for name, service in self.services.items())):
+                # Read the generation first: a change made while probing leaves
+                # this snapshot stale, so the next read rebuilds it
+                generation = self._state_gen
+                running = {name: service.is_running for name, service in self.services.items()}
+                health = {name: (running[name], healthy) for name, healthy in self._probe_all().items()}
+                snapshot = (health, generation, now)
+                self._snapshot_ref = snapshot
+            
+            health = snapshot[0]
             status = {}
             for name, service in self.services.items():
+                is_running = service.is_running
                 status[name] = {
-                    'running': service.is_running,
-                    'healthy': service.is_healthy()
+                    'running': is_running,
+                    'healthy': is_running and health.get(name, (False, False))[1]
                 }
-            return {'services': status}
+            
+            # Jitter the poll hint so renderers don't poll in lockstep
+            base = self._poll_hint_ms_base
+            jitter = random.randrange(-(base // 4), base // 4 + 1)
+            return {'services': status, 'next_poll_ms': base + jitter}
+    
+    def _probe_all(self) -> Dict[str, bool]:
+        """Run every service's health check in parallel; a check that errors or
+        outlasts the shared timeout counts as unhealthy."""
+        if self._probe_pool is None:
+            return {name: service.is_healthy() for name, service in self.services.items()}
+        
+        futures = {name: self._probe_pool.submit(service.is_healthy)
+                   for name, service in self.services.items()}
+        deadline = time.monotonic() + self.config.get('health_timeout_s', 2.0)
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except Exception as e:
+                self.logger.warning("Health check for %s failed: %r", name, e)
+                results[name] = False
+        return results
     
     def _handle_trading_command(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle trading command."""
@@ -225,7 +472,7 @@ class BackendBridge:
         parameters = data.get('parameters', {})
         
         # Trading command execution logic would go here
-        self.logger.info(f"Executing trading command: {command} with parameters: {parameters}")
+        self.logger.info("Executing trading command: %s with parameters: %s", command, parameters)
         
         return {'result': 'Trading command executed', 'command': command, 'parameters': parameters}
     
@@ -235,7 +482,7 @@ class BackendBridge:
         timeframe = data.get('timeframe', '1m')
         
         # Market data retrieval logic would go here
-        self.logger.debug(f"Retrieving market data for {symbol}")
+        self.logger.debug("Retrieving market data for %s", symbol)
         
         return {
             'symbol': symbol,
@@ -248,7 +495,7 @@ class BackendBridge:
         account_id = data.get('account_id')
         
         # Portfolio data retrieval logic would go here
-        self.logger.debug(f"Retrieving portfolio data for account {account_id}")
+        self.logger.debug("Retrieving portfolio data for account %s", account_id)
         
         return {
             'account_id': account_id,
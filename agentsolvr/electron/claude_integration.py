@@ -7,19 +7,63 @@ Includes desktop notifications, system tray status updates, and local caching.
 """
 
 import asyncio
+import collections
+import copy
+import hashlib
+import inspect
 import json
 import time
 import logging
-from typing import Dict, List, Any, Optional, Callable
+import sqlite3
+import threading
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .backend_bridge import BackendBridge
 from .system_tray import SystemTray
 
 
-@dataclass
+def _dumps_payload(data: Any):
+    """Serialize a cache payload, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(',', ':'))
+
+
+def _loads_payload(raw) -> Any:
+    """Deserialize a cache payload written by _dumps_payload."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _noop(*args, **kwargs):
+    """Stand-in for a disabled desktop feature."""
+
+
+async def _next_batch(queue: asyncio.Queue) -> list:
+    """Wait for one queued item, then drain whatever else is ready.
+    
+    Yields to the loop once before draining so producers scheduled in the
+    same tick land in the same batch, without a wait_for timer per item.
+    """
+    batch = [await queue.get()]
+    await asyncio.sleep(0)
+    while True:
+        try:
+            batch.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    return batch
+
+
+@dataclass(slots=True, frozen=True)
 class DesktopClaudeEvent:
     """Event data for desktop Claude integration notifications"""
     event_type: str
@@ -40,6 +84,18 @@ class ElectronClaudeIntegration:
     - Integration with Electron menu system
     """
 
+    # Cached responses expire after 24 hours
+    CACHE_TTL_SECONDS = 86400
+    
+    # Number of recent notifications kept in notification_queue
+    NOTIFICATION_HISTORY_LIMIT = 1000
+    
+    # Notifications shown within this many seconds reach the frontend as one batch
+    NOTIFICATION_BATCH_WINDOW = 0.05
+    
+    # Polled status and metrics responses are reused for this many seconds
+    STATUS_CACHE_TTL = 0.5
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize desktop Claude integration."""
         self.config = config or {}
@@ -51,11 +107,28 @@ class ElectronClaudeIntegration:
         
         # Desktop-specific state
         self.desktop_cache_path = Path.home() / ".agentsolv" / "claude_cache"
-        self.desktop_cache_path.mkdir(parents=True, exist_ok=True)
+        
+        # Cache store, opened on first use; writes happen on a worker thread,
+        # so all access is serialized by _cache_lock
+        self._cache_conn: Optional[sqlite3.Connection] = None
+        self._cache_lock = threading.Lock()
+        self._cache_count: Optional[int] = None
         
         # Event handling
-        self.event_listeners: Dict[str, List[Callable]] = {}
-        self.notification_queue = []
+        self.event_listeners: Dict[str, Tuple[Callable, ...]] = {}
+        self._listener_tasks: set = set()
+        self.notification_queue = collections.deque(maxlen=self.NOTIFICATION_HISTORY_LIMIT)
+        self._notifications_sent = 0
+        self._pending_notifications: List[Dict[str, Any]] = []
+        self._notification_flush_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._notification_flush_handle: Optional[asyncio.TimerHandle] = None
+        
+        # In-flight backend calls shared by identical concurrent requests
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+        # Background cache writer
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._cache_writer_task: Optional[asyncio.Task] = None
         
         # Status tracking
         self.claude_status = {
@@ -68,6 +141,16 @@ class ElectronClaudeIntegration:
             'cost_tracking': {'daily_usage': 0.0, 'monthly_usage': 0.0}
         }
         
+        # Snapshot of claude_status handed out by get_desktop_status; rebuilt by _set_status.
+        # Deep-copied so nested dicts (cost_tracking) are not shared with claude_status
+        self._status_snapshot = copy.deepcopy(self.claude_status)
+        
+        # Memoized responses for polled status/metrics
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_cache_expiry = 0.0
+        self._metrics_cache: Optional[Dict[str, Any]] = None
+        self._metrics_cache_expiry = 0.0
+        
         # Desktop configuration
         self.desktop_config = {
             'show_notifications': self.config.get('show_notifications', True),
@@ -77,6 +160,10 @@ class ElectronClaudeIntegration:
             'minimize_to_tray': self.config.get('minimize_to_tray', True)
         }
         
+        # Hot-path hooks bound once, since desktop_config is fixed after construction
+        self._maybe_notify = self._show_notification if self.desktop_config['show_notifications'] else _noop
+        self._maybe_cache = self._cache_desktop_response if self.desktop_config['auto_cache_responses'] else _noop
+        
         self.logger = logging.getLogger(__name__)
         
         # Initialize desktop features
@@ -92,9 +179,6 @@ class ElectronClaudeIntegration:
                 'status': 'disconnected'
             })
         
-        # Load cached data
-        self._load_desktop_cache()
-        
         # Register event listeners
         self.register_event_listener('connection_changed', self._update_tray_status)
         self.register_event_listener('authentication_changed', self._update_auth_status)
@@ -108,20 +192,21 @@ class ElectronClaudeIntegration:
             connection_result = await self.backend_bridge.connect_to_service('claude_integration')
             
             if connection_result['success']:
-                self.claude_status['connected'] = True
-                self.claude_status['last_activity'] = time.time()
+                now = time.time()
+                self._set_status(connected=True, last_activity=now)
                 
                 self._emit_event('connection_changed', {
                     'connected': True,
-                    'timestamp': time.time()
-                })
+                    'timestamp': now
+                }, timestamp=now)
                 
                 # Show desktop notification
                 if self.desktop_config['show_notifications']:
                     self._show_notification(
                         title="Claude Integration",
                         message="Connected to Claude Code API",
-                        type="info"
+                        type="info",
+                        timestamp=now
                     )
                 
                 return {
@@ -177,8 +262,7 @@ class ElectronClaudeIntegration:
                 }
             
             if auth_result['success']:
-                self.claude_status['authenticated'] = True
-                self.claude_status['auth_method'] = auth_method
+                self._set_status(authenticated=True, auth_method=auth_method)
                 
                 self._emit_event('authentication_changed', {
                     'authenticated': True,
@@ -221,20 +305,21 @@ class ElectronClaudeIntegration:
         """Analyze code with desktop-specific features."""
         try:
             # Check if we can use cached results
-            cache_result = self._check_desktop_cache('analyze_code', {
-                'code_hash': hash(code),
+            code_hash = self._content_digest(code)
+            cache_params = {
+                'code_hash': code_hash,
                 'analysis_type': analysis_type
-            })
+            }
+            cache_result = self._check_desktop_cache('analyze_code', cache_params)
             
             if cache_result:
                 # Show cache notification
-                if self.desktop_config['show_notifications']:
-                    self._show_notification(
-                        title="Code Analysis",
-                        message="Using cached analysis results",
-                        type="info",
-                        duration=3000
-                    )
+                self._maybe_notify(
+                    title="Code Analysis",
+                    message="Using cached analysis results",
+                    type="info",
+                    duration=3000
+                )
                 
                 return {
                     'success': True,
@@ -243,32 +328,31 @@ class ElectronClaudeIntegration:
                     'source': 'desktop_cache'
                 }
             
-            # Call backend Claude integration
-            analysis_result = await self.backend_bridge.call_service(
+            # Call backend Claude integration, sharing the call with identical in-flight requests
+            analysis_result = await self._call_backend_once(
+                self._cache_key('analyze_code', cache_params),
                 'claude_integration',
                 'analyze_code',
                 {'code': code, 'analysis_type': analysis_type}
             )
             
             if analysis_result['success']:
+                now = time.time()
+                
                 # Cache results if enabled
-                if self.desktop_config['auto_cache_responses']:
-                    self._cache_desktop_response('analyze_code', {
-                        'code_hash': hash(code),
-                        'analysis_type': analysis_type
-                    }, analysis_result['data'])
+                self._maybe_cache('analyze_code', cache_params, analysis_result['data'], timestamp=now)
                 
                 # Show completion notification
-                if self.desktop_config['show_notifications']:
-                    issues_count = len(analysis_result['data'].get('issues', []))
-                    self._show_notification(
-                        title="Code Analysis Complete",
-                        message=f"Found {issues_count} issues to review",
-                        type="success"
-                    )
+                issues_count = len(analysis_result['data'].get('issues', []))
+                self._maybe_notify(
+                    title="Code Analysis Complete",
+                    message=f"Found {issues_count} issues to review",
+                    type="success",
+                    timestamp=now
+                )
                 
                 # Update status
-                self.claude_status['last_activity'] = time.time()
+                self._set_status(last_activity=now)
                 
                 return {
                     'success': True,
@@ -279,12 +363,11 @@ class ElectronClaudeIntegration:
                 }
             else:
                 # Show error notification
-                if self.desktop_config['show_notifications']:
-                    self._show_notification(
-                        title="Code Analysis Failed",
-                        message=analysis_result.get('error', 'Unknown error'),
-                        type="error"
-                    )
+                self._maybe_notify(
+                    title="Code Analysis Failed",
+                    message=analysis_result.get('error', 'Unknown error'),
+                    type="error"
+                )
                 
                 return analysis_result
                 
@@ -299,13 +382,12 @@ class ElectronClaudeIntegration:
         """Generate tests with desktop integration."""
         try:
             # Show progress notification
-            if self.desktop_config['show_notifications']:
-                self._show_notification(
-                    title="Test Generation",
-                    message="Generating tests with Claude...",
-                    type="info",
-                    duration=5000
-                )
+            self._maybe_notify(
+                title="Test Generation",
+                message="Generating tests with Claude...",
+                type="info",
+                duration=5000
+            )
             
             test_result = await self.backend_bridge.call_service(
                 'claude_integration',
@@ -314,32 +396,32 @@ class ElectronClaudeIntegration:
             )
             
             if test_result['success']:
+                now = time.time()
+                
                 # Cache results
-                if self.desktop_config['auto_cache_responses']:
-                    self._cache_desktop_response('generate_tests', {
-                        'code_hash': hash(code),
-                        'framework': test_framework
-                    }, test_result['data'])
+                self._maybe_cache('generate_tests', {
+                    'code_hash': self._content_digest(code),
+                    'framework': test_framework
+                }, test_result['data'], timestamp=now)
                 
                 # Show success notification with test count
                 test_count = test_result['data'].get('test_count', 0)
-                if self.desktop_config['show_notifications']:
-                    self._show_notification(
-                        title="Test Generation Complete",
-                        message=f"Generated {test_count} tests for {test_framework}",
-                        type="success"
-                    )
+                self._maybe_notify(
+                    title="Test Generation Complete",
+                    message=f"Generated {test_count} tests for {test_framework}",
+                    type="success",
+                    timestamp=now
+                )
                 
-                self.claude_status['last_activity'] = time.time()
+                self._set_status(last_activity=now)
                 return test_result
             else:
                 # Show error notification
-                if self.desktop_config['show_notifications']:
-                    self._show_notification(
-                        title="Test Generation Failed",
-                        message=test_result.get('error', 'Unknown error'),
-                        type="error"
-                    )
+                self._maybe_notify(
+                    title="Test Generation Failed",
+                    message=test_result.get('error', 'Unknown error'),
+                    type="error"
+                )
                 
                 return test_result
                 
@@ -350,13 +432,30 @@ class ElectronClaudeIntegration:
                 'error': f"Desktop test generation failed: {str(e)}"
             }
 
+    async def _call_backend_once(self, key: str, service_name: str, method: str,
+                                 params: Optional[Dict[str, Any]] = None) -> Any:
+        """Share one in-flight backend call among concurrent identical requests."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self.backend_bridge.call_service(service_name, method, params))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield so one caller being cancelled doesn't cancel the call for the others
+        return await asyncio.shield(future)
+
     def get_desktop_status(self) -> Dict[str, Any]:
         """Get comprehensive desktop Claude status."""
+        now = time.monotonic()
+        if self._status_cache is not None and now < self._status_cache_expiry:
+            # Callers get their own copy, nested dicts included; the cached one is never handed out
+            return copy.deepcopy(self._status_cache)
+        
         rate_limit_status = self._get_rate_limit_status()
         cost_status = self._get_cost_status()
         
-        return {
-            'claude_integration': self.claude_status.copy(),
+        self._status_cache = {
+            'claude_integration': self._status_snapshot,
             'rate_limits': rate_limit_status,
             'cost_tracking': cost_status,
             'desktop_features': {
@@ -368,15 +467,28 @@ class ElectronClaudeIntegration:
             },
             'last_updated': time.time()
         }
+        self._status_cache_expiry = now + self.STATUS_CACHE_TTL
+        return copy.deepcopy(self._status_cache)
+
+    def _set_status(self, **fields):
+        """Update Claude status fields and rebuild the published snapshot."""
+        self.claude_status.update(fields)
+        self._status_snapshot = copy.deepcopy(self.claude_status)
+        self._invalidate_status_cache()
+
+    def _invalidate_status_cache(self):
+        """Drop the cached status so the next poll reflects a state change."""
+        self._status_cache = None
 
     def toggle_offline_mode(self, offline: bool) -> Dict[str, Any]:
         """Toggle offline mode for desktop usage."""
-        self.claude_status['offline_mode'] = offline
+        self._set_status(offline_mode=offline)
+        cache_size = self._get_cache_size()
         
         if offline:
             # Switch to offline mode
             self._emit_event('offline_mode_enabled', {
-                'cached_responses_available': self._get_cache_size()
+                'cached_responses_available': cache_size
             })
             
             if self.desktop_config['show_notifications']:
@@ -398,30 +510,50 @@ class ElectronClaudeIntegration:
         
         return {
             'offline_mode': offline,
-            'cache_available': self._get_cache_size() > 0,
+            'cache_available': cache_size > 0,
             'last_activity': self.claude_status['last_activity']
         }
 
     def register_event_listener(self, event_type: str, callback: Callable):
         """Register event listener for desktop notifications."""
-        if event_type not in self.event_listeners:
-            self.event_listeners[event_type] = []
-        self.event_listeners[event_type].append(callback)
+        # Copy-on-write so an emit in progress keeps iterating its own tuple
+        self.event_listeners[event_type] = self.event_listeners.get(event_type, ()) + (callback,)
 
-    def _emit_event(self, event_type: str, data: Dict[str, Any]):
+    def _emit_event(self, event_type: str, data: Dict[str, Any], timestamp: Optional[float] = None):
         """Emit event to registered listeners."""
         event = DesktopClaudeEvent(
             event_type=event_type,
             data=data,
-            timestamp=time.time()
+            timestamp=timestamp if timestamp is not None else time.time()
         )
         
-        if event_type in self.event_listeners:
-            for callback in self.event_listeners[event_type]:
-                try:
+        for callback in self.event_listeners.get(event_type, ()):
+            try:
+                if inspect.iscoroutinefunction(callback):
+                    self._run_async_listener(callback(event))
+                else:
                     callback(event)
-                except Exception as e:
-                    self.logger.error(f"Event listener error: {e}")
+            except Exception as e:
+                self.logger.error(f"Event listener error: {e}")
+
+    def _run_async_listener(self, coro):
+        """Run an async listener without blocking the emitter."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Emitted outside an event loop; run the listener to completion
+            asyncio.run(coro)
+            return
+        
+        task = loop.create_task(coro)
+        self._listener_tasks.add(task)
+        task.add_done_callback(self._on_listener_done)
+
+    def _on_listener_done(self, task: asyncio.Task):
+        """Release a finished async listener task and report its failure."""
+        self._listener_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error(f"Event listener error: {task.exception()}")
 
     def _update_tray_status(self, event: DesktopClaudeEvent):
         """Update system tray status based on Claude connection."""
@@ -477,71 +609,184 @@ class ElectronClaudeIntegration:
                 type="warning"
             )
 
-    def _show_notification(self, title: str, message: str, type: str = "info", duration: int = 5000):
+    def _show_notification(self, title: str, message: str, type: str = "info", duration: int = 5000,
+                           timestamp: Optional[float] = None):
         """Show desktop notification."""
         notification = {
             'title': title,
             'message': message,
             'type': type,  # info, success, warning, error
             'duration': duration,
-            'timestamp': time.time(),
+            'timestamp': timestamp if timestamp is not None else time.time(),
             'sound': self.desktop_config['notification_sound']
         }
         
         self.notification_queue.append(notification)
+        self._notifications_sent += 1
         
         # Emit to Electron frontend for display
         self._emit_event('desktop_notification', notification)
+        
+        # Also coalesce bursts into one batch event for frontends that render them together
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        
+        if self._notification_flush_loop is not None and self._notification_flush_loop is not loop:
+            # The flush scheduled on the previous loop may never run (it may be closed)
+            self._flush_notifications()
+        
+        self._pending_notifications.append(notification)
+        if loop is None:
+            self._flush_notifications()  # No loop to defer the flush to
+        elif self._notification_flush_handle is None:
+            self._notification_flush_loop = loop
+            self._notification_flush_handle = loop.call_later(
+                self.NOTIFICATION_BATCH_WINDOW, self._flush_notifications
+            )
+
+    def _flush_notifications(self):
+        """Emit pending notifications to the frontend as a single batch."""
+        if self._notification_flush_handle is not None:
+            self._notification_flush_handle.cancel()
+        self._notification_flush_handle = None
+        self._notification_flush_loop = None
+        notifications, self._pending_notifications = self._pending_notifications, []
+        if notifications:
+            self._emit_event('desktop_notifications_batch', {'notifications': notifications})
+
+    @staticmethod
+    def _content_digest(content: str) -> str:
+        """Get a digest of content that is stable across processes."""
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _cache_key(self, operation: str, params: Dict[str, Any]) -> str:
+        """Build the cache key for an operation and its parameters."""
+        return f"{operation}_{self._content_digest(json.dumps(params, sort_keys=True))}"
 
     def _check_desktop_cache(self, operation: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Check desktop cache for cached responses."""
-        cache_key = f"{operation}_{hash(str(sorted(params.items())))}"
-        cache_file = self.desktop_cache_path / f"{cache_key}.json"
+        cache_key = self._cache_key(operation, params)
         
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    cache_data = json.load(f)
-                
-                # Check cache expiry (24 hours)
-                if time.time() - cache_data['timestamp'] < 86400:
-                    return cache_data['response']
-            except Exception as e:
-                self.logger.error(f"Cache read error: {e}")
+        try:
+            # Entries outlive the process, so expiry uses wall-clock time; entries
+            # stamped in the future (clock moved back) are treated as expired
+            now = time.time()
+            with self._cache_lock:
+                row = self._cache_connection().execute(
+                    "SELECT response FROM responses WHERE cache_key = ? AND timestamp > ? AND timestamp <= ?",
+                    (cache_key, now - self.CACHE_TTL_SECONDS, now)
+                ).fetchone()
+            if row:
+                return _loads_payload(row[0])
+        except Exception as e:
+            self.logger.error(f"Cache read error: {e}")
         
         return None
 
-    def _cache_desktop_response(self, operation: str, params: Dict[str, Any], response: Dict[str, Any]):
+    def _cache_desktop_response(self, operation: str, params: Dict[str, Any], response: Dict[str, Any],
+                                timestamp: Optional[float] = None):
         """Cache response for desktop offline usage."""
-        cache_key = f"{operation}_{hash(str(sorted(params.items())))}"
-        cache_file = self.desktop_cache_path / f"{cache_key}.json"
-        
-        cache_data = {
-            'operation': operation,
-            'params': params,
-            'response': response,
-            'timestamp': time.time()
-        }
+        entry = (self._cache_key(operation, params), operation,
+                 _dumps_payload(params), _dumps_payload(response),
+                 timestamp if timestamp is not None else time.time())
         
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to hand the write off to
+            self._write_cache_entries([entry])
+            return
+        
+        if self._cache_writer_task is None or self._cache_writer_task.done():
+            self._write_queue = asyncio.Queue()
+            self._cache_writer_task = asyncio.create_task(self._cache_writer(self._write_queue))
+        self._write_queue.put_nowait(entry)
+
+    async def _cache_writer(self, queue: asyncio.Queue):
+        """Write queued cache entries off the event loop until a None sentinel arrives."""
+        while True:
+            entries = await _next_batch(queue)
+            stop = None in entries
+            if stop:
+                entries = [entry for entry in entries if entry is not None]
+            if entries:
+                await asyncio.to_thread(self._write_cache_entries, entries)
+            if stop:
+                return
+
+    async def close(self):
+        """Flush pending notifications and queued cache writes, then close the cache store."""
+        self._flush_notifications()
+        
+        task = self._cache_writer_task
+        if task is not None and not task.done():
+            self._write_queue.put_nowait(None)
+            await task
+        self._cache_writer_task = None
+        self._write_queue = None
+        
+        with self._cache_lock:
+            if self._cache_conn is not None:
+                self._cache_conn.close()
+                self._cache_conn = None
+
+    def _write_cache_entries(self, entries: List[Tuple[str, str, Any, Any, float]]):
+        """Write serialized cache entries to the cache store."""
+        try:
+            with self._cache_lock, self._cache_connection() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    entries
+                )
+            self._cache_count = None  # May have replaced existing entries; recount lazily
         except Exception as e:
             self.logger.error(f"Cache write error: {e}")
 
+    def _cache_connection(self) -> sqlite3.Connection:
+        """Get the cache store connection, opening it on first use.
+        
+        Callers must hold _cache_lock.
+        """
+        if self._cache_conn is None:
+            self._load_desktop_cache()
+        return self._cache_conn
+
     def _load_desktop_cache(self):
-        """Load existing desktop cache."""
-        if not self.desktop_cache_path.exists():
-            return
+        """Open the desktop cache store and drop expired responses."""
+        self.desktop_cache_path.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(self.desktop_cache_path / "responses.db"),
+            check_same_thread=False
+        )
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "cache_key TEXT PRIMARY KEY, operation TEXT NOT NULL, params TEXT NOT NULL, "
+                "response TEXT NOT NULL, timestamp REAL NOT NULL)"
+            )
+            conn.execute(
+                "DELETE FROM responses WHERE timestamp <= ?",
+                (time.time() - self.CACHE_TTL_SECONDS,)
+            )
         
-        cache_files = list(self.desktop_cache_path.glob("*.json"))
-        self.logger.info(f"Found {len(cache_files)} cached responses")
+        self._cache_conn = conn
+        self._cache_count = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        self.logger.info(f"Found {self._cache_count} cached responses")
 
     def _get_cache_size(self) -> int:
         """Get number of cached responses."""
-        if not self.desktop_cache_path.exists():
-            return 0
-        return len(list(self.desktop_cache_path.glob("*.json")))
+        if self._cache_count is None:
+            if self._cache_conn is None and not (self.desktop_cache_path / "responses.db").exists():
+                # Nothing cached yet; don't create the store just to count it
+                self._cache_count = 0
+            else:
+                with self._cache_lock:
+                    self._cache_count = self._cache_connection().execute(
+                        "SELECT COUNT(*) FROM responses"
+                    ).fetchone()[0]
+        return self._cache_count
 
     def _get_offline_capabilities(self) -> Dict[str, bool]:
         """Get available offline capabilities."""
@@ -581,12 +826,10 @@ class ElectronClaudeIntegration:
     def clear_desktop_cache(self) -> Dict[str, Any]:
         """Clear desktop cache."""
         try:
-            cache_files = list(self.desktop_cache_path.glob("*.json"))
-            files_removed = 0
-            
-            for cache_file in cache_files:
-                cache_file.unlink()
-                files_removed += 1
+            with self._cache_lock, self._cache_connection() as conn:
+                files_removed = conn.execute("DELETE FROM responses").rowcount
+            self._cache_count = 0
+            self._invalidate_status_cache()
             
             if self.desktop_config['show_notifications']:
                 self._show_notification(
@@ -609,12 +852,18 @@ class ElectronClaudeIntegration:
 
     def get_desktop_metrics(self) -> Dict[str, Any]:
         """Get desktop-specific metrics."""
-        return {
+        now = time.monotonic()
+        if self._metrics_cache is not None and now < self._metrics_cache_expiry:
+            return copy.deepcopy(self._metrics_cache)
+        
+        self._metrics_cache = {
             'session_duration': time.time() - (self.claude_status.get('session_start', time.time())),
-            'notifications_sent': len(self.notification_queue),
+            'notifications_sent': self._notifications_sent,
             'cache_hit_rate': 0.85,  # Would be calculated from actual usage
             'offline_requests_served': 0,  # Would track offline usage
             'total_requests': 0,  # Would track all requests
             'average_response_time': 1.5,  # Would track response times
             'desktop_integration_health': 'excellent'
-        }
\ No newline at end of file
+        }
+        self._metrics_cache_expiry = now + self.STATUS_CACHE_TTL
+        return copy.deepcopy(self._metrics_cache)
\ No newline at end of file
@@ -8,9 +8,58 @@ of the AgentTradr application, enabling offline trading capabilities.
 import os
 import sys
 import json
+import atexit
+import hashlib
 import logging
+import logging.handlers
+import queue
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared by every application log handler
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that writes through a 64 KiB buffer instead of flushing per record."""
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=1 << 16,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def flush(self) -> None:
+        # StreamHandler.emit calls this after every record; let the buffer fill
+        # instead. close() still flushes when the stream is closed.
+        pass
+    
+    def force_flush(self) -> None:
+        """Write out buffered records now."""
+        self.acquire()
+        try:
+            if self.stream:
+                self.stream.flush()
+        finally:
+            self.release()
+
+
+# Absolute paths already created by this process
+_ENSURED_DIRS: set = set()
+
+
+def _ensure_dir(directory: str) -> bool:
+    """Create directory once per process; return True if it was created now."""
+    path = os.path.abspath(directory)
+    if path in _ENSURED_DIRS:
+        return False
+    os.makedirs(path, exist_ok=True)
+    _ENSURED_DIRS.add(path)
+    return True
 
 
 class ElectronAppConfig:
@@ -19,6 +68,8 @@ class ElectronAppConfig:
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path or self._get_default_config_path()
         self.config: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
+        self._last_saved_digest: Optional[bytes] = None
         self.load_config()
     
     def _get_default_config_path(self) -> str:
@@ -30,21 +81,50 @@ class ElectronAppConfig:
         """Load configuration from file."""
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    self.config = json.load(f)
+                raw = Path(self.config_path).read_bytes()
+                self.config = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                self._last_saved_digest = hashlib.blake2b(raw).digest()
             else:
                 self.config = self._get_default_config()
                 self.save_config()
         except Exception as e:
             logging.error(f"Failed to load config: {e}")
             self.config = self._get_default_config()
+        self._flatten()
+    
+    def _flatten(self) -> None:
+        """Index every value in the config by its dot notation key."""
+        flat = {}
+        
+        def walk(prefix: str, node: Dict[str, Any]) -> None:
+            for k, v in node.items():
+                key = f"{prefix}.{k}" if prefix else k
+                flat[key] = v
+                if isinstance(v, dict):
+                    walk(key, v)
+        
+        walk("", self.config)
+        self._flat = flat
     
     def save_config(self) -> None:
         """Save configuration to file."""
         try:
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.config, indent=2).encode()
+            self._flatten()
+            
+            # Skip the write entirely when the file already holds this content
+            digest = hashlib.blake2b(data).digest()
+            if digest == self._last_saved_digest:
+                return
+            
+            _ensure_dir(os.path.dirname(self.config_path))
+            tmp_path = f"{self.config_path}.tmp"
+            Path(tmp_path).write_bytes(data)
+            os.replace(tmp_path, self.config_path)
+            self._last_saved_digest = digest
         except Exception as e:
             logging.error(f"Failed to save config: {e}")
     
@@ -74,15 +154,21 @@ class ElectronAppConfig:
         }
     
     def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value by dot notation key."""
-        keys = key.split('.')
-        value = self.config
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        return value
+        """Get configuration value by dot notation key.
+        
+        Values come from an index rebuilt by load_config, save_config and set;
+        edit self.config in place only if one of those is called afterwards.
+        """
+        return self._flat.get(key, default)
+    
+    def set(self, key: str, value: Any) -> None:
+        """Set configuration value by dot notation key."""
+        *parents, leaf = key.split('.')
+        node = self.config
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = value
+        self._flatten()
 
 
 class ElectronApp:
@@ -90,21 +176,59 @@ class ElectronApp:
     
     def __init__(self):
         self.config = ElectronAppConfig()
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
+        self._log_handlers: List[logging.Handler] = []
+        self._log_queue_handler: Optional[logging.handlers.QueueHandler] = None
         self.setup_logging()
         self.logger = logging.getLogger(__name__)
         self.is_running = False
+        self._stop_event = threading.Event()
     
     def setup_logging(self) -> None:
         """Setup application logging."""
         log_level = logging.DEBUG if self.config.get('app.debug') else logging.INFO
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler('electron_app.log')
-            ]
+        root = logging.getLogger()
+        if root.handlers:
+            # Logging is already configured; leave it alone like basicConfig would
+            return
+        
+        # Records are handed to a background listener so callers never block on I/O
+        handlers = [
+            logging.StreamHandler(sys.stdout),
+            BufferedFileHandler('electron_app.log')
+        ]
+        for handler in handlers:
+            handler.setFormatter(_LOG_FORMATTER)
+        
+        log_queue = queue.Queue(-1)
+        self._log_handlers = handlers
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
         )
+        self._log_listener.start()
+        atexit.register(self._stop_logging)
+        
+        root.setLevel(log_level)
+        self._log_queue_handler = logging.handlers.QueueHandler(log_queue)
+        root.addHandler(self._log_queue_handler)
+    
+    def _stop_logging(self) -> None:
+        """Drain queued log records, stop the background listener and flush to disk.
+        
+        The handlers are then attached to the root logger directly, so records
+        logged after this point (later shutdown steps, atexit hooks) still land.
+        """
+        if self._log_listener is not None:
+            root = logging.getLogger()
+            root.removeHandler(self._log_queue_handler)
+            self._log_queue_handler = None
+            self._log_listener.stop()
+            self._log_listener = None
+            for handler in self._log_handlers:
+                handler.flush()
+                if isinstance(handler, BufferedFileHandler):
+                    handler.force_flush()
+                root.addHandler(handler)
     
     def initialize(self) -> bool:
         """Initialize the Electron application."""
@@ -138,13 +262,13 @@ class ElectronApp:
         ]
         
         for directory in directories:
-            os.makedirs(directory, exist_ok=True)
-            self.logger.debug(f"Created directory: {directory}")
+            if _ensure_dir(directory):
+                self.logger.debug(f"Created directory: {directory}")
     
     def _initialize_database(self) -> None:
         """Initialize the local database."""
         db_path = self.config.get('database.path', './data/agenttradr.db')
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        _ensure_dir(os.path.dirname(db_path))
         
         # Database initialization would go here
         self.logger.info(f"Database initialized at: {db_path}")
@@ -170,6 +294,7 @@ class ElectronApp:
         try:
             self.logger.info("Starting AgentTradr Electron app...")
             self.is_running = True
+            self._stop_event.clear()
             
             # Start the main application loop
             self._run_main_loop()
@@ -189,13 +314,10 @@ class ElectronApp:
         # This would typically handle Electron window management,
         # backend server coordination, etc.
         
-        while self.is_running:
-            try:
-                # Application logic here
-                pass
-            except Exception as e:
-                self.logger.error(f"Error in main loop: {e}")
-                break
+        # Sleep until stop() is called rather than spinning on is_running; the
+        # bounded wait keeps the main thread responsive to KeyboardInterrupt
+        while not self._stop_event.wait(timeout=1.0):
+            pass
     
     def stop(self) -> None:
         """Stop the Electron application."""
@@ -204,9 +326,11 @@ class ElectronApp:
         
         self.logger.info("Stopping AgentTradr Electron app...")
         self.is_running = False
+        self._stop_event.set()
         
         # Cleanup logic would go here
         self.logger.info("App stopped successfully")
+        self._stop_logging()
 
 
 def main() -> None:
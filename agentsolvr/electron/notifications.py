@@ -6,12 +6,14 @@ Provides rich notifications with actions, progress tracking, and intelligent que
 """
 
 import time
+import heapq
+import itertools
 import threading
-import queue
 import logging
-from typing import Dict, List, Any, Optional, Callable, Union
+from collections import deque
+from typing import Deque, Dict, List, Any, Optional, Callable, Set, Union
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
 from datetime import datetime, timedelta
 
 from .system_tray import SystemTrayManager, TrayNotification, TrayIconStatus
@@ -29,7 +31,7 @@ class NotificationType(Enum):
     USER_ACTION_REQUIRED = "user_action_required"
 
 
-class NotificationPriority(Enum):
+class NotificationPriority(IntEnum):
     """Notification priority levels."""
     LOW = 1
     NORMAL = 2
@@ -38,7 +40,7 @@ class NotificationPriority(Enum):
     URGENT = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationAction:
     """Represents an action button in a notification."""
     id: str
@@ -48,7 +50,7 @@ class NotificationAction:
     style: str = "default"  # default, primary, secondary, danger
 
 
-@dataclass
+@dataclass(slots=True)
 class DesktopNotification:
     """Enhanced desktop notification with rich features."""
     id: str
@@ -84,6 +86,37 @@ class DesktopNotification:
     data: Dict[str, Any] = field(default_factory=dict)
 
 
+# Source of IDs for notifications created without one
+_id_counter = itertools.count(1)
+
+# Minimum priority that still gets through do not disturb
+_CRITICAL_VALUE = NotificationPriority.CRITICAL
+
+# show_system_status lookups by status
+_STATUS_ICONS = {
+    'connected': 'status_connected',
+    'disconnected': 'status_disconnected',
+    'error': 'status_error',
+    'warning': 'status_warning',
+    'maintenance': 'status_maintenance'
+}
+
+_STATUS_TYPES = {
+    'connected': NotificationType.SUCCESS,
+    'disconnected': NotificationType.WARNING,
+    'error': NotificationType.ERROR,
+    'warning': NotificationType.WARNING,
+    'maintenance': NotificationType.INFO
+}
+
+# Tray icon state for Claude connection statuses
+_TRAY_STATUS_MAP = {
+    'connected': TrayIconStatus.ACTIVE,
+    'disconnected': TrayIconStatus.OFFLINE,
+    'error': TrayIconStatus.ERROR
+}
+
+
 class NotificationCenter:
     """
     Advanced notification center for desktop integration.
@@ -102,8 +135,20 @@ class NotificationCenter:
         
         # Notification management
         self.active_notifications: Dict[str, DesktopNotification] = {}
-        self.notification_queue = queue.PriorityQueue()
-        self.notification_history: List[DesktopNotification] = []
+        # Active notification ids by group_id, maintained alongside active_notifications
+        self._by_group: Dict[str, Set[str]] = {}
+        # Pending notifications as a heap of [-priority, seq, notification]; seq
+        # breaks ties in FIFO order so notifications themselves are never compared.
+        # Entries are lists so a queued notification can be swapped in place.
+        # _heap_event is set while the heap may be non-empty.
+        self._heap: List[list] = []
+        self._heap_lock = threading.Lock()
+        self._heap_event = threading.Event()
+        # Signalled when a dismissal frees a display slot
+        self._slot_condition = threading.Condition(self._heap_lock)
+        self._seq = itertools.count()
+        # Queued heap entries by replace_id, so repeated updates coalesce
+        self._pending_by_replace: Dict[str, list] = {}
         
         # Configuration
         self.config = {
@@ -115,11 +160,26 @@ class NotificationCenter:
             'do_not_disturb_hours': None,  # (start_hour, end_hour)
             'priority_escalation': True
         }
+        # Oldest entries fall off the left once history_limit is reached
+        self.notification_history: Deque[DesktopNotification] = deque(maxlen=self.config['history_limit'])
         
         # State tracking
         self.is_active = True
         self.do_not_disturb = False
+        # Monotonic time at which do not disturb switches itself off, if timed
+        self._dnd_until: Optional[float] = None
         self.processing_thread = None
+        
+        # Auto-dismiss deadlines, served by one timer thread: a heap of
+        # (monotonic deadline, seq, reason, notification id)
+        self._timers: List[tuple] = []
+        self._timer_condition = threading.Condition()
+        self._timer_thread = None
+        
+        # Queued notifications not yet displayed, for wait_until_idle
+        self._pending_count = 0
+        self._idle_condition = threading.Condition()
+        
         self.stats = {
             'total_sent': 0,
             'dismissed_count': 0,
@@ -132,6 +192,20 @@ class NotificationCenter:
         self.claude_session_active = False
         self.claude_activity_notifications = {}
         
+        # Action buttons are the same on every notification of a kind; build them once
+        self._claude_complete_actions = (
+            NotificationAction("view_results", "View Results", callback=self._view_claude_results),
+            NotificationAction("run_tests", "Generate Tests", callback=self._generate_tests_action)
+        )
+        self._claude_failed_actions = (
+            NotificationAction("retry", "Retry", callback=self._retry_claude_operation),
+            NotificationAction("view_error", "View Error", callback=self._view_error_details)
+        )
+        self._cost_alert_actions = (
+            NotificationAction("view_usage", "View Usage Details", callback=self._view_usage_details),
+            NotificationAction("adjust_limits", "Adjust Limits", callback=self._adjust_cost_limits)
+        )
+        
         self._start_processing()
 
     def _start_processing(self):
@@ -144,65 +218,137 @@ class NotificationCenter:
             daemon=True
         )
         self.processing_thread.start()
+        
+        self._timer_thread = threading.Thread(
+            target=self._timer_loop,
+            daemon=True
+        )
+        self._timer_thread.start()
         self.logger.info("Notification center started")
 
     def show_notification(self, notification: DesktopNotification) -> str:
         """Show a desktop notification."""
+        if not self.is_active:
+            return ""
+        if not self._admit_notification(notification):
+            return notification.id
+        
+        # Add to queue with priority
+        with self._heap_lock:
+            self._enqueue_locked([notification])
+        
+        self.logger.debug("Queued notification: %s (priority: %s)", notification.id, notification.priority.name)
+        return notification.id
+
+    def show_notifications(self, notifications: List[DesktopNotification]) -> List[str]:
+        """Show several desktop notifications, queueing them in one pass."""
+        if not self.is_active:
+            return []
+        admitted = [n for n in notifications if self._admit_notification(n)]
+        
+        with self._heap_lock:
+            self._enqueue_locked(admitted)
+        
+        self.logger.debug("Queued %d of %d notifications", len(admitted), len(notifications))
+        return [n.id for n in notifications]
+
+    def _enqueue_locked(self, notifications: List[DesktopNotification]) -> None:
+        """Push notifications onto the heap; caller holds _heap_lock.
+        
+        A notification whose replace_id matches one still queued takes over that
+        entry instead of queueing a second display.
+        """
+        pushed = 0
+        resort = False
+        for notification in notifications:
+            priority_key = -notification.priority
+            entry = self._pending_by_replace.get(notification.replace_id) if notification.replace_id else None
+            if entry is not None:
+                entry[2] = notification
+                if entry[0] != priority_key:
+                    entry[0] = priority_key
+                    resort = True
+                continue
+            
+            entry = [priority_key, next(self._seq), notification]
+            heapq.heappush(self._heap, entry)
+            if notification.replace_id:
+                self._pending_by_replace[notification.replace_id] = entry
+            pushed += 1
+        
+        if resort:
+            heapq.heapify(self._heap)
+        if pushed:
+            with self._idle_condition:
+                self._pending_count += pushed
+        if self._heap:
+            self._heap_event.set()
+    
+    def _blocked_by_dnd(self, priority: NotificationPriority, notification_id: str) -> bool:
+        """Return True if do not disturb suppresses a notification of this priority."""
+        if self._dnd_active() and priority < _CRITICAL_VALUE:
+            self.logger.debug("Notification blocked by DND: %s", notification_id)
+            return True
+        return False
+
+    def _admit_notification(self, notification: DesktopNotification) -> bool:
+        """Assign an ID and apply DND/replacement rules; False if blocked."""
         # Generate ID if not provided
         if not notification.id:
-            notification.id = f"notif_{int(time.time() * 1000)}_{hash(notification.title)}"
+            notification.id = f"notif_{next(_id_counter)}"
         
         # Check for do not disturb
-        if self.do_not_disturb and notification.priority.value < NotificationPriority.CRITICAL.value:
-            self.logger.debug(f"Notification blocked by DND: {notification.id}")
-            return notification.id
+        if self._blocked_by_dnd(notification.priority, notification.id):
+            return False
         
         # Handle replacement notifications
         if notification.replace_id and notification.replace_id in self.active_notifications:
             self._dismiss_notification(notification.replace_id, "replaced")
         
-        # Add to queue with priority
-        priority_value = (100 - notification.priority.value, notification.timestamp)
-        self.notification_queue.put((priority_value, notification))
-        
-        self.logger.debug(f"Queued notification: {notification.id} (priority: {notification.priority.name})")
-        return notification.id
+        return True
 
     def show_claude_notification(self, 
                                 operation: str, 
                                 status: str, 
                                 details: Optional[Dict] = None) -> str:
         """Show Claude-specific notification."""
+        notification_id = f"claude_{operation}_{int(time.time())}"
+        self.stats['claude_notifications'] += 1
+        # Skip building the message when do not disturb would drop it anyway
+        if self._blocked_by_dnd(NotificationPriority.NORMAL, notification_id):
+            return notification_id
+        
         details = details or {}
+        op_title = operation.title()
         
         # Determine notification type and message
         if status == "started":
-            title = f"Claude {operation.title()}"
+            title = f"Claude {op_title}"
             message = f"Starting {operation}..."
             notif_type = NotificationType.CLAUDE_ACTIVITY
             icon = "claude_working"
         elif status == "completed":
-            title = f"Claude {operation.title()} Complete"
+            title = f"Claude {op_title} Complete"
             tokens = details.get('tokens_used', 0)
             cost = details.get('cost_estimate', 0.0)
             message = f"Analysis complete. Tokens: {tokens}, Cost: ${cost:.3f}"
             notif_type = NotificationType.SUCCESS
             icon = "claude_success"
         elif status == "failed":
-            title = f"Claude {operation.title()} Failed"
+            title = f"Claude {op_title} Failed"
             error = details.get('error', 'Unknown error')
             message = f"Operation failed: {error}"
             notif_type = NotificationType.ERROR
             icon = "claude_error"
         else:
-            title = f"Claude {operation.title()}"
+            title = f"Claude {op_title}"
             message = details.get('message', f"Claude {operation} {status}")
             notif_type = NotificationType.INFO
             icon = "claude_info"
         
         # Create notification
         notification = DesktopNotification(
-            id=f"claude_{operation}_{int(time.time())}",
+            id=notification_id,
             title=title,
             message=message,
             type=notif_type,
@@ -216,17 +362,10 @@ class NotificationCenter:
         
         # Add relevant actions
         if status == "completed" and operation == "analyze_code":
-            notification.actions = [
-                NotificationAction("view_results", "View Results", callback=self._view_claude_results),
-                NotificationAction("run_tests", "Generate Tests", callback=self._generate_tests_action)
-            ]
+            notification.actions = list(self._claude_complete_actions)
         elif status == "failed":
-            notification.actions = [
-                NotificationAction("retry", "Retry", callback=self._retry_claude_operation),
-                NotificationAction("view_error", "View Error", callback=self._view_error_details)
-            ]
+            notification.actions = list(self._claude_failed_actions)
         
-        self.stats['claude_notifications'] += 1
         return self.show_notification(notification)
 
     def show_progress_notification(self, 
@@ -255,61 +394,48 @@ class NotificationCenter:
                           status: str, 
                           details: Optional[str] = None) -> str:
         """Show system status notification."""
-        status_icons = {
-            'connected': 'status_connected',
-            'disconnected': 'status_disconnected',
-            'error': 'status_error',
-            'warning': 'status_warning',
-            'maintenance': 'status_maintenance'
-        }
+        notification_id = f"system_{component}_{status}"
         
-        status_types = {
-            'connected': NotificationType.SUCCESS,
-            'disconnected': NotificationType.WARNING,
-            'error': NotificationType.ERROR,
-            'warning': NotificationType.WARNING,
-            'maintenance': NotificationType.INFO
-        }
+        # Update system tray status
+        if component == "claude" and status in _TRAY_STATUS_MAP:
+            self.system_tray.update_status(_TRAY_STATUS_MAP[status], f"Claude: {status}")
+        
+        self.stats['system_notifications'] += 1
+        priority = NotificationPriority.HIGH if status == 'error' else NotificationPriority.NORMAL
+        # The tray status above still updates; only the popup is suppressed
+        if self._blocked_by_dnd(priority, notification_id):
+            return notification_id
         
         notification = DesktopNotification(
-            id=f"system_{component}_{status}",
+            id=notification_id,
             title=f"{component.title()} {status.title()}",
             message=details or f"{component} is {status}",
-            type=status_types.get(status, NotificationType.INFO),
-            priority=NotificationPriority.HIGH if status == 'error' else NotificationPriority.NORMAL,
-            icon=status_icons.get(status, 'status_info'),
+            type=_STATUS_TYPES.get(status, NotificationType.INFO),
+            priority=priority,
+            icon=_STATUS_ICONS.get(status, 'status_info'),
             source="system",
             tags=["system", component, status],
             group_id=f"system_{component}"
         )
         
-        # Update system tray status
-        if component == "claude" and status in ['connected', 'disconnected', 'error']:
-            tray_status = {
-                'connected': TrayIconStatus.ACTIVE,
-                'disconnected': TrayIconStatus.OFFLINE,
-                'error': TrayIconStatus.ERROR
-            }[status]
-            self.system_tray.update_status(tray_status, f"Claude: {status}")
-        
-        self.stats['system_notifications'] += 1
         return self.show_notification(notification)
 
     def show_cost_alert(self, current_cost: float, threshold: float, period: str = "daily") -> str:
         """Show cost threshold alert."""
         percentage = (current_cost / threshold) * 100
+        notification_id = f"cost_alert_{period}"
+        priority = NotificationPriority.HIGH if percentage >= 100 else NotificationPriority.NORMAL
+        if self._blocked_by_dnd(priority, notification_id):
+            return notification_id
         
         notification = DesktopNotification(
-            id=f"cost_alert_{period}",
+            id=notification_id,
             title="Cost Alert",
             message=f"{period.title()} usage: ${current_cost:.2f} ({percentage:.1f}% of ${threshold:.2f} limit)",
             type=NotificationType.WARNING if percentage >= 80 else NotificationType.INFO,
-            priority=NotificationPriority.HIGH if percentage >= 100 else NotificationPriority.NORMAL,
+            priority=priority,
             icon="cost_warning",
-            actions=[
-                NotificationAction("view_usage", "View Usage Details", callback=self._view_usage_details),
-                NotificationAction("adjust_limits", "Adjust Limits", callback=self._adjust_cost_limits)
-            ],
+            actions=list(self._cost_alert_actions),
             source="cost_monitor",
             tags=["cost", "alert", period],
             group_id="cost_monitoring"
@@ -324,10 +450,8 @@ class NotificationCenter:
     def dismiss_group(self, group_id: str) -> int:
         """Dismiss all notifications in a group."""
         dismissed_count = 0
-        to_dismiss = [nid for nid, notif in self.active_notifications.items() 
-                     if notif.group_id == group_id]
         
-        for notification_id in to_dismiss:
+        for notification_id in list(self._by_group.get(group_id, ())):
             if self._dismiss_notification(notification_id, "group_dismissed"):
                 dismissed_count += 1
         
@@ -336,21 +460,25 @@ class NotificationCenter:
     def set_do_not_disturb(self, enabled: bool, duration_minutes: Optional[int] = None):
         """Enable or disable do not disturb mode."""
         self.do_not_disturb = enabled
+        # Automatic disable is checked lazily against this deadline
+        self._dnd_until = time.monotonic() + duration_minutes * 60 if enabled and duration_minutes else None
         
         if enabled:
-            self.logger.info(f"Do not disturb enabled{f' for {duration_minutes} minutes' if duration_minutes else ''}")
-            
-            # Schedule automatic disable
             if duration_minutes:
-                def disable_dnd():
-                    time.sleep(duration_minutes * 60)
-                    self.do_not_disturb = False
-                    self.logger.info("Do not disturb automatically disabled")
-                
-                threading.Thread(target=disable_dnd, daemon=True).start()
+                self.logger.info("Do not disturb enabled for %s minutes", duration_minutes)
+            else:
+                self.logger.info("Do not disturb enabled")
         else:
             self.logger.info("Do not disturb disabled")
 
+    def _dnd_active(self) -> bool:
+        """Return whether do not disturb is on, switching it off once its deadline passes."""
+        if self.do_not_disturb and self._dnd_until is not None and time.monotonic() >= self._dnd_until:
+            self.do_not_disturb = False
+            self._dnd_until = None
+            self.logger.info("Do not disturb automatically disabled")
+        return self.do_not_disturb
+
     def get_active_notifications(self) -> List[DesktopNotification]:
         """Get list of currently active notifications."""
         return list(self.active_notifications.values())
@@ -360,11 +488,19 @@ class NotificationCenter:
         return {
             **self.stats,
             'active_count': len(self.active_notifications),
-            'queue_size': self.notification_queue.qsize(),
+            'queue_size': len(self._heap),
             'history_count': len(self.notification_history),
-            'do_not_disturb': self.do_not_disturb
+            'do_not_disturb': self._dnd_active()
         }
 
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued notification has been displayed.
+        
+        Returns False if the timeout expired first.
+        """
+        with self._idle_condition:
+            return self._idle_condition.wait_for(lambda: self._pending_count == 0, timeout)
+
     def clear_all_notifications(self) -> int:
         """Clear all active notifications."""
         count = len(self.active_notifications)
@@ -372,73 +508,130 @@ class NotificationCenter:
         for notification_id in list(self.active_notifications.keys()):
             self._dismiss_notification(notification_id, "cleared_all")
         
-        self.logger.info(f"Cleared {count} notifications")
+        self.logger.info("Cleared %d notifications", count)
         return count
 
     def _process_notification_queue(self):
         """Process the notification queue in a separate thread."""
         while self.is_active:
             try:
-                # Get next notification (blocking with timeout)
-                try:
-                    priority_tuple, notification = self.notification_queue.get(timeout=1.0)
-                except queue.Empty:
-                    continue
-                
-                # Check if we can display more notifications
-                if len(self.active_notifications) >= self.config['max_simultaneous']:
-                    # Put back in queue and wait
-                    self.notification_queue.put((priority_tuple, notification))
-                    time.sleep(0.5)
+                # Wait for something to be queued (with timeout to re-check is_active)
+                if not self._heap_event.wait(1.0):
                     continue
                 
-                # Display the notification
-                self._display_notification(notification)
+                with self._heap_lock:
+                    if not self._heap:
+                        self._heap_event.clear()
+                        continue
+                    
+                    # Take as many as there are free display slots in one pass; the
+                    # rest stay queued until a dismissal frees a slot
+                    slots = self.config['max_simultaneous'] - len(self.active_notifications)
+                    if slots <= 0:
+                        self._slot_condition.wait(1.0)
+                        continue
+                    batch = []
+                    while self._heap and len(batch) < slots:
+                        entry = heapq.heappop(self._heap)
+                        notification = entry[2]
+                        if self._pending_by_replace.get(notification.replace_id) is entry:
+                            del self._pending_by_replace[notification.replace_id]
+                        batch.append(notification)
+                    if not self._heap:
+                        self._heap_event.clear()
                 
-                # Mark task as done
-                self.notification_queue.task_done()
+                # Display the batch
+                self._display_notifications(batch)
+                with self._idle_condition:
+                    self._pending_count -= len(batch)
+                    if self._pending_count == 0:
+                        self._idle_condition.notify_all()
                 
             except Exception as e:
-                self.logger.error(f"Error processing notification queue: {e}")
+                self.logger.error("Error processing notification queue: %s", e)
                 time.sleep(1)
 
     def _display_notification(self, notification: DesktopNotification):
         """Display a single notification."""
-        try:
-            # Add to active notifications
-            self.active_notifications[notification.id] = notification
-            
-            # Add to history
-            self.notification_history.append(notification)
-            if len(self.notification_history) > self.config['history_limit']:
-                self.notification_history.pop(0)
-            
-            # Create system tray notification
-            tray_notification = TrayNotification(
-                title=notification.title,
-                body=notification.message,
-                timeout=notification.duration,
-                click_handler=notification.click_callback
-            )
-            
-            # Show via system tray
-            self.system_tray.show_notification(tray_notification)
-            
-            # Update stats
-            self.stats['total_sent'] += 1
-            
-            # Auto-dismiss if duration is set
-            if notification.duration > 0:
-                def auto_dismiss():
-                    time.sleep(notification.duration / 1000.0)
-                    self._dismiss_notification(notification.id, "auto_dismissed")
+        self._display_notifications([notification])
+
+    def _display_notifications(self, notifications: List[DesktopNotification]):
+        """Display notifications, handing them to the system tray in one call."""
+        tray_notifications = []
+        displayed = []
+        for notification in notifications:
+            try:
+                # Add to active notifications
+                self.active_notifications[notification.id] = notification
+                if notification.group_id:
+                    self._by_group.setdefault(notification.group_id, set()).add(notification.id)
                 
-                threading.Thread(target=auto_dismiss, daemon=True).start()
-            
-            self.logger.info(f"Displayed notification: {notification.id}")
-            
+                # Add to history
+                self.notification_history.append(notification)
+                
+                # Create system tray notification
+                tray_notifications.append(TrayNotification(
+                    title=notification.title,
+                    body=notification.message,
+                    timeout=notification.duration,
+                    click_handler=notification.click_callback
+                ))
+                
+                # Update stats
+                self.stats['total_sent'] += 1
+                
+                # Auto-dismiss if duration is set
+                if notification.duration > 0:
+                    self._schedule(notification.duration / 1000.0, "auto_dismissed", notification.id)
+                
+                displayed.append(notification.id)
+                
+            except Exception as e:
+                self.logger.error("Failed to display notification %s: %s", notification.id, e)
+        
+        # Show via system tray
+        try:
+            self.system_tray.show_notifications(tray_notifications)
         except Exception as e:
-            self.logger.error(f"Failed to display notification {notification.id}: {e}")
+            self.logger.error("Failed to show notifications in system tray: %s", e)
+            return
+        
+        for notification_id in displayed:
+            self.logger.info("Displayed notification: %s", notification_id)
+
+    def _schedule(self, delay: float, reason: str, notification_id: str) -> None:
+        """Schedule a notification to be dismissed delay seconds from now."""
+        with self._timer_condition:
+            entry = (time.monotonic() + delay, next(self._seq), reason, notification_id)
+            heapq.heappush(self._timers, entry)
+            # Only a new earliest deadline changes how long the timer thread sleeps
+            if self._timers[0] is entry:
+                self._timer_condition.notify()
+
+    def _timer_loop(self):
+        """Dismiss notifications as their display deadlines come due."""
+        while self.is_active:
+            with self._timer_condition:
+                # Re-check under the lock: stop() may have notified before we got here
+                if not self.is_active:
+                    break
+                now = time.monotonic()
+                # Waits are bounded (as in the queue loop) so is_active is re-checked
+                if not self._timers:
+                    self._timer_condition.wait(1.0)
+                    continue
+                if self._timers[0][0] > now:
+                    self._timer_condition.wait(min(self._timers[0][0] - now, 1.0))
+                    continue
+                due = []
+                while self._timers and self._timers[0][0] <= now:
+                    due.append(heapq.heappop(self._timers))
+            
+            for _, _, reason, notification_id in due:
+                try:
+                    self._dismiss_notification(notification_id, reason)
+                except Exception as e:
+                    self.logger.error("Error dismissing notification %s: %s", notification_id, e)
 
     def _dismiss_notification(self, notification_id: str, reason: str) -> bool:
         """Dismiss a notification."""
@@ -446,16 +639,25 @@ class NotificationCenter:
             return False
         
         notification = self.active_notifications.pop(notification_id)
+        if notification.group_id:
+            members = self._by_group.get(notification.group_id)
+            if members is not None:
+                members.discard(notification_id)
+                if not members:
+                    del self._by_group[notification.group_id]
         
         # Call dismiss callback if provided
         if notification.dismiss_callback:
             try:
                 notification.dismiss_callback(notification, reason)
             except Exception as e:
-                self.logger.error(f"Error in dismiss callback: {e}")
+                self.logger.error("Error in dismiss callback: %s", e)
+        
+        with self._slot_condition:
+            self._slot_condition.notify()
         
         self.stats['dismissed_count'] += 1
-        self.logger.debug(f"Dismissed notification {notification_id}: {reason}")
+        self.logger.debug("Dismissed notification %s: %s", notification_id, reason)
         return True
 
     # Action handlers
@@ -472,7 +674,7 @@ class NotificationCenter:
     def _retry_claude_operation(self, notification: DesktopNotification, action: NotificationAction):
         """Handle retry Claude operation action."""
         operation = notification.tags[1] if len(notification.tags) > 1 else "unknown"
-        self.logger.info(f"Retrying Claude operation: {operation}")
+        self.logger.info("Retrying Claude operation: %s", operation)
         # This would retry the failed operation
 
     def _view_error_details(self, notification: DesktopNotification, action: NotificationAction):
@@ -493,8 +695,27 @@ class NotificationCenter:
     def stop(self):
         """Stop the notification center."""
         self.is_active = False
+        with self._timer_condition:
+            self._timer_condition.notify()
+        with self._slot_condition:
+            self._slot_condition.notify()
+        self._heap_event.set()
         if self.processing_thread:
             self.processing_thread.join(timeout=5.0)
+        if self._timer_thread:
+            self._timer_thread.join(timeout=5.0)
+        
+        # Drop anything still queued or showing so it can be freed
+        with self._heap_lock:
+            self._heap.clear()
+            self._pending_by_replace.clear()
+        with self._timer_condition:
+            self._timers.clear()
+        self.active_notifications.clear()
+        self._by_group.clear()
+        with self._idle_condition:
+            self._pending_count = 0
+            self._idle_condition.notify_all()
         self.logger.info("Notification center stopped")
 
 
@@ -6,13 +6,19 @@ for the AgentCODR V4 Electron application.
 """
 
 import logging
+import queue
 import threading
 import time
-from typing import Dict, Any, List, Optional, Callable
+from collections import deque
+from typing import Deque, Dict, Any, List, MutableSequence, Optional, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 
+# Queued by destroy() to stop the notification processor
+_STOP = object()
+
+
 class TrayIconStatus(Enum):
     """System tray icon status states."""
     IDLE = "idle"
@@ -22,7 +28,11 @@ class TrayIconStatus(Enum):
     OFFLINE = "offline"
 
 
-@dataclass
+# Tooltip shown for each status when the caller does not supply one
+_DEFAULT_TOOLTIPS = {status: f"AgentCODR V4 - {status.value.title()}" for status in TrayIconStatus}
+
+
+@dataclass(slots=True)
 class TrayMenuItem:
     """Represents a system tray context menu item."""
     id: str
@@ -31,11 +41,11 @@ class TrayMenuItem:
     enabled: bool = True
     visible: bool = True
     checked: bool = False
-    submenu: Optional[List['TrayMenuItem']] = None
+    submenu: Optional[MutableSequence['TrayMenuItem']] = None
     click_handler: Optional[Callable] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TrayNotification:
     """Represents a system tray notification."""
     title: str
@@ -53,9 +63,14 @@ class SystemTrayManager:
         self.is_created = False
         self.current_status = TrayIconStatus.IDLE
         self.menu_items: List[TrayMenuItem] = []
-        self.notification_queue: List[TrayNotification] = []
+        # Menu item id -> (containing list, item)
+        self._item_index: Dict[str, Tuple[MutableSequence[TrayMenuItem], TrayMenuItem]] = {}
+        self._recent_submenu: Optional[Deque[TrayMenuItem]] = None
+        self.notification_queue: "queue.Queue[TrayNotification]" = queue.Queue()
         self.status_update_handlers: List[Callable] = []
         self.click_handlers: Dict[str, Callable] = {}
+        # Menu item id -> handler to invoke on click; registered handlers win
+        self._dispatch: Dict[str, Callable] = {}
         self._notification_thread = None
         self._status_icons = {
             TrayIconStatus.IDLE: "assets/tray-idle.png",
@@ -89,6 +104,11 @@ class SystemTrayManager:
     
     def _create_default_menu(self) -> None:
         """Create the default context menu."""
+        # Ring buffer of the last 5 activities, newest first
+        self._recent_submenu = deque(
+            [TrayMenuItem(id="no_activity", label="No recent activity", enabled=False)],
+            maxlen=5
+        )
         self.menu_items = [
             TrayMenuItem(
                 id="show_window",
@@ -112,9 +132,7 @@ class SystemTrayManager:
             TrayMenuItem(
                 id="recent_activity",
                 label="Recent Activity",
-                submenu=[
-                    TrayMenuItem(id="no_activity", label="No recent activity", enabled=False)
-                ]
+                submenu=self._recent_submenu
             ),
             TrayMenuItem(
                 id="separator2", 
@@ -142,6 +160,10 @@ class SystemTrayManager:
                 click_handler=self._handle_quit
             )
         ]
+        self._item_index.clear()
+        self._dispatch.clear()
+        self._index_items(self.menu_items)
+        self._dispatch.update(self.click_handlers)
     
     def update_status(self, status: TrayIconStatus, tooltip: Optional[str] = None) -> None:
         """Update the tray icon status and tooltip."""
@@ -153,9 +175,9 @@ class SystemTrayManager:
         icon_path = self._status_icons.get(status, "assets/tray-default.png")
         
         if tooltip is None:
-            tooltip = f"AgentCODR V4 - {status.value.title()}"
+            tooltip = _DEFAULT_TOOLTIPS[status]
         
-        self.logger.debug(f"Updated tray status to {status.value}")
+        self.logger.debug("Updated tray status to %s", status.value)
         
         # Notify status update handlers
         for handler in self.status_update_handlers:
@@ -170,28 +192,43 @@ class SystemTrayManager:
             self.logger.warning("Cannot show notification - tray not created")
             return
         
-        self.notification_queue.append(notification)
-        self.logger.debug(f"Queued notification: {notification.title}")
+        self.notification_queue.put(notification)
+        self.logger.debug("Queued notification: %s", notification.title)
+    
+    def show_notifications(self, notifications: List[TrayNotification]) -> None:
+        """Show several system tray notifications, checking tray state once."""
+        if not notifications:
+            return
+        if not self.is_created:
+            self.logger.warning("Cannot show notifications - tray not created")
+            return
+        
+        for notification in notifications:
+            self.notification_queue.put(notification)
+        self.logger.debug("Queued %d notifications", len(notifications))
     
     def update_menu_item(self, item_id: str, **kwargs) -> bool:
         """Update a menu item's properties."""
-        def update_item(items: List[TrayMenuItem]) -> bool:
-            for item in items:
-                if item.id == item_id:
-                    for key, value in kwargs.items():
-                        if hasattr(item, key):
-                            setattr(item, key, value)
-                    return True
-                if item.submenu and update_item(item.submenu):
-                    return True
-            return False
-        
-        if update_item(self.menu_items):
-            self.logger.debug(f"Updated menu item {item_id}")
-            return True
-        else:
+        entry = self._item_index.get(item_id)
+        if entry is None:
             self.logger.warning(f"Menu item {item_id} not found")
             return False
+        
+        item = entry[1]
+        for key, value in kwargs.items():
+            if hasattr(item, key):
+                if key == "submenu":
+                    self._unindex_items(item.submenu or [])
+                    self._index_items(value or [])
+                elif key == "click_handler" and item_id not in self.click_handlers:
+                    if value:
+                        self._dispatch[item_id] = value
+                    else:
+                        self._dispatch.pop(item_id, None)
+                setattr(item, key, value)
+        
+        self.logger.debug("Updated menu item %s", item_id)
+        return True
     
     def add_menu_item(self, item: TrayMenuItem, position: Optional[int] = None) -> None:
         """Add a new menu item."""
@@ -199,26 +236,48 @@ class SystemTrayManager:
             self.menu_items.append(item)
         else:
             self.menu_items.insert(position, item)
+        self._index_items([item], self.menu_items)
         
-        self.logger.debug(f"Added menu item {item.id}")
+        self.logger.debug("Added menu item %s", item.id)
     
     def remove_menu_item(self, item_id: str) -> bool:
         """Remove a menu item."""
-        def remove_item(items: List[TrayMenuItem]) -> bool:
-            for i, item in enumerate(items):
-                if item.id == item_id:
-                    items.pop(i)
-                    return True
-                if item.submenu and remove_item(item.submenu):
-                    return True
-            return False
-        
-        if remove_item(self.menu_items):
-            self.logger.debug(f"Removed menu item {item_id}")
-            return True
-        else:
+        entry = self._item_index.get(item_id)
+        if entry is None:
             self.logger.warning(f"Menu item {item_id} not found")
             return False
+        
+        parent, item = entry
+        for i, candidate in enumerate(parent):
+            if candidate is item:
+                del parent[i]
+                break
+        self._unindex_items([item])
+        
+        self.logger.debug("Removed menu item %s", item_id)
+        return True
+    
+    def _index_items(self, items: MutableSequence[TrayMenuItem],
+                     parent: Optional[MutableSequence[TrayMenuItem]] = None) -> None:
+        """Record items (and their submenus) in the id index under parent."""
+        parent = items if parent is None else parent
+        for item in items:
+            self._item_index[item.id] = (parent, item)
+            if item.click_handler and item.id not in self.click_handlers:
+                self._dispatch[item.id] = item.click_handler
+            if item.submenu:
+                self._index_items(item.submenu)
+    
+    def _unindex_items(self, items: MutableSequence[TrayMenuItem]) -> None:
+        """Drop items (and their submenus) from the id index."""
+        for item in items:
+            entry = self._item_index.get(item.id)
+            if entry is not None and entry[1] is item:
+                del self._item_index[item.id]
+                if item.id not in self.click_handlers:
+                    self._dispatch.pop(item.id, None)
+            if item.submenu:
+                self._unindex_items(item.submenu)
     
     def update_agent_status(self, active_agents: int, working_agents: int, error_agents: int) -> None:
         """Update agent status in the menu."""
@@ -237,11 +296,11 @@ class SystemTrayManager:
     def add_recent_activity(self, activity: str, timestamp: Optional[str] = None) -> None:
         """Add a recent activity item to the menu."""
         if timestamp is None:
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+            timestamp = time.strftime("%H:%M:%S")
         
         # Remove "no activity" placeholder if it exists
-        self.remove_menu_item("no_activity")
+        if "no_activity" in self._item_index:
+            self.remove_menu_item("no_activity")
         
         # Add new activity item
         activity_item = TrayMenuItem(
@@ -250,16 +309,15 @@ class SystemTrayManager:
             enabled=False
         )
         
-        # Find recent activity submenu and add item
-        for item in self.menu_items:
-            if item.id == "recent_activity" and item.submenu:
-                item.submenu.insert(0, activity_item)
-                # Keep only last 5 activities
-                if len(item.submenu) > 5:
-                    item.submenu = item.submenu[:5]
-                break
+        # Add to the recent activity ring buffer; the oldest entry falls off
+        submenu = self._recent_submenu
+        if submenu is not None:
+            if len(submenu) == submenu.maxlen:
+                self._unindex_items([submenu[-1]])
+            submenu.appendleft(activity_item)
+            self._index_items([activity_item], submenu)
         
-        self.logger.debug(f"Added recent activity: {activity}")
+        self.logger.debug("Added recent activity: %s", activity)
     
     def register_status_handler(self, handler: Callable) -> None:
         """Register a status update handler."""
@@ -268,6 +326,19 @@ class SystemTrayManager:
     def register_click_handler(self, menu_id: str, handler: Callable) -> None:
         """Register a click handler for a menu item."""
         self.click_handlers[menu_id] = handler
+        self._dispatch[menu_id] = handler
+    
+    def handle_menu_click(self, menu_id: str) -> bool:
+        """Invoke the click handler for a menu item; False if it has none."""
+        handler = self._dispatch.get(menu_id)
+        if handler is None:
+            return False
+        
+        try:
+            handler()
+        except Exception as e:
+            self.logger.error(f"Error in click handler for {menu_id}: {e}")
+        return True
     
     def add_status_indicator(self, indicator_id: str, config: Dict[str, Any]) -> None:
         """Add a status indicator to the system tray."""
@@ -284,19 +355,19 @@ class SystemTrayManager:
         
         self._notification_thread = threading.Thread(
             target=self._process_notifications,
+            args=(self.notification_queue,),
             daemon=True
         )
         self._notification_thread.start()
     
-    def _process_notifications(self) -> None:
-        """Process queued notifications."""
+    def _process_notifications(self, notification_queue: "queue.Queue[TrayNotification]") -> None:
+        """Process notifications from this worker's queue until it receives _STOP."""
         while True:
             try:
-                if self.notification_queue:
-                    notification = self.notification_queue.pop(0)
-                    self._display_notification(notification)
-                else:
-                    time.sleep(0.1)  # Small delay when queue is empty
+                notification = notification_queue.get()
+                if notification is _STOP:
+                    break
+                self._display_notification(notification)
             except Exception as e:
                 self.logger.error(f"Error processing notifications: {e}")
                 time.sleep(1)
@@ -312,7 +383,7 @@ class SystemTrayManager:
             # Simulate notification display time
             time.sleep(notification.timeout / 1000.0)
             
-            self.logger.debug(f"Notification displayed: {notification.title}")
+            self.logger.debug("Notification displayed: %s", notification.title)
             
         except Exception as e:
             self.logger.error(f"Failed to display notification: {e}")
@@ -337,24 +408,35 @@ class SystemTrayManager:
         self.logger.debug("Quit clicked")
         # This would typically trigger application shutdown
     
-    def destroy(self) -> None:
+    def destroy(self, join_timeout: float = 1.0) -> None:
         """Destroy the system tray."""
         if not self.is_created:
             return
         
         self.logger.info("Destroying system tray")
         
-        # Stop notification processing
+        # Drop pending notifications, then stop notification processing
+        while True:
+            try:
+                self.notification_queue.get_nowait()
+            except queue.Empty:
+                break
         if self._notification_thread and self._notification_thread.is_alive():
-            # In a real implementation, we'd properly signal the thread to stop
-            pass
+            self.notification_queue.put(_STOP)
+            self._notification_thread.join(join_timeout)
+        # A worker still finishing a notification after the join timeout keeps the
+        # old queue and its _STOP; the next create_tray starts a fresh worker
+        self.notification_queue = queue.Queue()
+        self._notification_thread = None
         
         self.is_created = False
         self.current_status = TrayIconStatus.OFFLINE
         self.menu_items.clear()
-        self.notification_queue.clear()
+        self._item_index.clear()
+        self._recent_submenu = None
         self.status_update_handlers.clear()
         self.click_handlers.clear()
+        self._dispatch.clear()
         
         self.logger.info("System tray destroyed")
 
@@ -75,7 +75,7 @@ class ElectronWindow:
             return
         
         self.is_visible = True
-        self.logger.debug(f"Window {self.window_id} shown")
+        self.logger.debug("Window %s shown", self.window_id)
     
     def hide(self) -> None:
         """Hide the window."""
@@ -83,7 +83,7 @@ class ElectronWindow:
             return
         
         self.is_visible = False
-        self.logger.debug(f"Window {self.window_id} hidden")
+        self.logger.debug("Window %s hidden", self.window_id)
     
     def close(self) -> None:
         """Close the window."""
@@ -91,7 +91,7 @@ class ElectronWindow:
             return
         
         self.is_visible = False
-        self.logger.debug(f"Window {self.window_id} closed")
+        self.logger.debug("Window %s closed", self.window_id)
     
     def destroy(self) -> None:
         """Destroy the window."""
@@ -100,7 +100,7 @@ class ElectronWindow:
         
         self.is_visible = False
         self.is_destroyed = True
-        self.logger.debug(f"Window {self.window_id} destroyed")
+        self.logger.debug("Window %s destroyed", self.window_id)
     
     def send_message(self, channel: str, data: Any) -> None:
         """Send a message to the renderer process."""
@@ -109,7 +109,7 @@ class ElectronWindow:
             return
         
         # Message sending logic would go here
-        self.logger.debug(f"Sent message to {self.window_id} on channel {channel}")
+        self.logger.debug("Sent message to %s on channel %s", self.window_id, channel)
 
 
 class WindowManager:
@@ -117,6 +117,8 @@ class WindowManager:
     
     def __init__(self):
         self.windows: Dict[str, ElectronWindow] = {}
+        # Windows not yet destroyed, in creation order, for broadcasts
+        self._live_windows: List[ElectronWindow] = []
         self.logger = logging.getLogger(__name__)
     
     def create_window(self, window_id: str, config: Dict[str, Any]) -> Optional[ElectronWindow]:
@@ -131,6 +133,7 @@ class WindowManager:
             
             if window.create():
                 self.windows[window_id] = window
+                self._live_windows.append(window)
                 self.logger.info(f"Window {window_id} registered")
                 return window
             else:
@@ -161,6 +164,9 @@ class WindowManager:
         if window:
             window.destroy()
             del self.windows[window_id]
+            if window in self._live_windows:
+                # Already gone if a broadcast pruned it after an earlier destroy
+                self._live_windows.remove(window)
             self.logger.info(f"Window {window_id} destroyed and removed")
             return True
         else:
@@ -186,7 +192,13 @@ class WindowManager:
     
     def broadcast_message(self, channel: str, data: Any) -> None:
         """Broadcast a message to all windows."""
-        for window in self.windows.values():
-            if not window.is_destroyed:
-                window.send_message(channel, data)
-        self.logger.debug(f"Broadcasted message on channel {channel}")
\ No newline at end of file
+        live = []
+        for window in self._live_windows:
+            # Windows closed outside destroy_window are dropped here
+            if window.is_destroyed:
+                continue
+            window.send_message(channel, data)
+            live.append(window)
+        if len(live) != len(self._live_windows):
+            self._live_windows = live
+        self.logger.debug("Broadcasted message on channel %s", channel)
\ No newline at end of file